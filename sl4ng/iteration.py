@@ -480,14 +480,14 @@ def powerset(iterable: Iterable[Any]) -> regenerator:
     )
 
 
-def sample(iterable: Iterable[Any], size: int) -> tuple:
+def sample(iterable: Iterable[Any], size: int, rng: Any = random) -> tuple:
     """
     Obtains a random sample of any length from any iterable and returns it as a tuple
     Unlike random.sample, this may yield the same element several times.
+    The draws are made by rng.choices, the random module by default, pass a seeded random.Random for reproducible or independent streams
     """
-    consumable = regenerator(iterable)
-    choiceIndices = tuple(random.randint(0, len(consumable) - 1) for i in range(size))
-    return tuple(consumable[i] for i in choiceIndices)
+    population = iterable if isinstance(iterable, Sequence) else tuple(iterable)
+    return tuple(rng.choices(population, k=size))
 
 
 def shuffle(iterable: Iterable[Any]) -> tuple:
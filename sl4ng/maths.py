@@ -1,13 +1,22 @@
 # A house for small stones
 
+from array import array
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from functools import lru_cache, reduce
-from itertools import chain, combinations, count
-from math import pi, ceil
-from typing import Iterable, Generator
+from itertools import accumulate, compress, count, islice
+from itertools import repeat as _repeat
+from math import pi, ceil, isqrt, log
+import math
+from typing import Callable, Iterable, Generator
 from numbers import Number, Real, Complex, Integral
+import mmap
+import os
+import struct
 
 # from .types import regenerator
-from .iteration import flat, regenerator
+from .iteration import flat
 
 
 def sign(number: Real) -> str:
@@ -25,30 +34,454 @@ def pyramid(length: Integral, shift: Integral = 0) -> Real:
     return val
 
 
+PRIME_CACHE = os.environ.get(
+    "SL4NG_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "sl4ng")
+)
+
+
+PRIME_TABLE_CAP = int(os.environ.get("SL4NG_PRIME_CAP", 1 << 30))
+
+
+def _sieve_bits(limit: Integral, segment: Integral = 1 << 23) -> Generator:
+    """
+    Sieve the odd numbers below limit (a multiple of 16) and yield, piece by piece, the bitset whose i-th bit marks 2i+1 as prime
+    Only segment odd numbers are held in memory at a time
+    """
+    m = limit // 2
+    root = isqrt(limit - 1)
+    small = bytearray([1]) * (root + 1)
+    odd = []
+    for p in range(3, root + 1, 2):
+        if small[p]:
+            odd.append(p)
+            small[p * p :: p] = bytes(len(range(p * p, root + 1, p)))
+    for lo in range(0, m, segment):
+        hi = min(lo + segment, m)
+        flags = bytearray([1]) * (hi - lo)
+        if not lo:
+            flags[0] = 0
+        for p in odd:
+            start = p * p // 2
+            if start < lo:
+                start = lo + (p // 2 - lo) % p
+            flags[start - lo :: p] = bytes(len(range(start, hi, p)))
+        yield _pack_bits(flags)
+
+
+def _pack_bits(flags: bytes) -> bytes:
+    """
+    Pack a sequence of 0/1 bytes into a little-endian bitset, eight flags per byte
+    """
+    flags = bytes(flags) + bytes(-len(flags) % 8)
+    packed = 0
+    for j in range(8):
+        packed |= int.from_bytes(flags[j::8], "little") << j
+    return packed.to_bytes(len(flags) // 8, "little")
+
+
+_BITS = tuple(tuple(j for j in range(8) if b >> j & 1) for b in range(256))
+
+
+def _as_int(n: Number) -> Integral | None:
+    """
+    An integral value, such as 7.0, as an int, or None if the value is not an integer
+    """
+    try:
+        m = int(n)
+    except (OverflowError, ValueError):
+        return None
+    return m if m == n else None
+
+
+class PrimeTable:
+    """
+    A read-only bitset of the odd primes below some limit, memory-mapped from a file so that every process shares one copy
+    Requesting a larger limit re-sieves, segment by segment, atomically replaces the file, and remaps it
+    The table never grows past cap (SL4NG_PRIME_CAP, 2**30 by default), primes beyond it are sieved on the fly or tested with isprime
+    If the cache file cannot be written the table is kept in memory instead
+        >>> table = PrimeTable(limit=100)
+        >>> 97 in table
+        True
+        >>> [*table.primes(20)]
+        [2, 3, 5, 7, 11, 13, 17, 19]
+    """
+
+    header = struct.Struct("<8sQ")
+    magic = b"sl4ngpt1"
+
+    def __init__(
+        self,
+        path: str = None,
+        limit: Integral = 1 << 20,
+        cap: Integral = PRIME_TABLE_CAP,
+    ):
+        self.path = path or os.path.join(PRIME_CACHE, "primes.bits")
+        self.cap = cap
+        self.limit = 0
+        self._data = b""
+        self._load()
+        self.grow(limit)
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as fob:
+                data = mmap.mmap(fob.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
+        if len(data) < self.header.size:
+            return
+        magic, limit = self.header.unpack_from(data)
+        if magic == self.magic and limit > self.limit:
+            if len(data) >= self.header.size + limit // 16:
+                self._data, self.limit = data, limit
+
+    def grow(self, limit: Integral) -> "PrimeTable":
+        """
+        Make sure the table covers every integer below limit, or below cap if that is smaller, rebuilding the shared file if it does not
+        """
+        limit = min(limit, self.cap)
+        if limit <= self.limit:
+            return self
+        self._load()
+        if limit <= self.limit:
+            return self
+        limit = min(max(limit, 2 * self.limit), self.cap)
+        limit += -limit % 16
+        header = self.header.pack(self.magic, limit)
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp, "wb") as fob:
+                fob.write(header)
+                for piece in _sieve_bits(limit):
+                    fob.write(piece)
+            os.replace(tmp, self.path)
+        except OSError:
+            self._data, self.limit = header + b"".join(_sieve_bits(limit)), limit
+            return self
+        self._load()
+        if self.limit < limit:
+            self._data, self.limit = header + b"".join(_sieve_bits(limit)), limit
+        return self
+
+    def __contains__(self, n: Integral) -> bool:
+        if not isinstance(n, int) and (n := _as_int(n)) is None:
+            return False
+        if n >= self.limit:
+            return isprime(n)
+        if n < 3:
+            return n == 2
+        if not n & 1:
+            return False
+        i = n >> 1
+        return self._data[self.header.size + (i >> 3)] >> (i & 7) & 1 == 1
+
+    def primes(self, stop: Integral, start: Integral = 2) -> Generator:
+        """
+        Yield the primes in the half-open interval [start, stop) in ascending order
+        Those beyond the table's cap are sieved a segment at a time
+        """
+        self.grow(stop)
+        if start <= 2 < stop:
+            yield 2
+        lo, hi = max(start, 3) >> 1, min(stop, self.limit) >> 1
+        data, offset = self._data, self.header.size
+        for k in range(lo >> 3, (hi + 7) >> 3):
+            for j in _BITS[data[offset + k]]:
+                if lo <= (i := 8 * k + j) < hi:
+                    yield 2 * i + 1
+        for lo in range(max(start, self.limit), stop, 1 << 20):
+            hi = min(lo + (1 << 20), stop)
+            yield from compress(range(lo, hi), _segment(lo, hi))
+
+    def count(self, stop: Integral) -> Integral:
+        """
+        Count the primes below stop
+        """
+        self.grow(stop)
+        if stop < 3:
+            return 0
+        hi = min(stop, self.limit) >> 1
+        offset = self.header.size
+        whole = int.from_bytes(self._data[offset : offset + (hi >> 3)], "little")
+        tail = self._data[offset + (hi >> 3)] & ((1 << (hi & 7)) - 1) if hi & 7 else 0
+        beyond = sum(
+            _segment(lo, min(lo + (1 << 20), stop)).count(1)
+            for lo in range(self.limit, stop, 1 << 20)
+        )
+        return 1 + whole.bit_count() + tail.bit_count() + beyond
+
+
+_prime_table = None
+
+
+def prime_table(limit: Integral = 0) -> PrimeTable:
+    """
+    Get this process' shared PrimeTable, grown to cover every integer below the given limit (or its cap)
+    The cache file lives in the directory named by the SL4NG_CACHE environment variable (~/.cache/sl4ng by default)
+    """
+    global _prime_table
+    if _prime_table is None:
+        _prime_table = PrimeTable()
+    return _prime_table.grow(limit)
+
+
+def _nth_prime_bound(n: Integral) -> Integral:
+    """
+    An upper bound for the n-th prime (Rosser's theorem and its refinement for n >= 6)
+    """
+    if n < 6:
+        return 12
+    return int(n * (log(n) + log(log(n)))) + 1
+
+
 def first_primes(n: Integral) -> list:
     """
     Generates a list of the first n primes. A cast will be used if the input is not an integer
     """
-    n = int(n) - 1
-    bank = []
-    track = 2
-    while len(bank) < n + 1:
-        if all(track % y for y in range(2, min(track, 11))):
-            bank.append(track)
-        track += 1
-    return sorted(set(bank))
+    n = int(n)
+    if n < 1:
+        return []
+    bound = _nth_prime_bound(n)
+    return list(islice(prime_table(bound).primes(bound), n))
 
 
 def primeslt(n: Integral) -> Generator:
     """
     Generates a list of primes with value lower than the input integer
     """
-    return (x for x in range(n) if x > 1 and all(x % y for y in range(2, min(x, 11))))
+    return prime_table(n).primes(n)
 
 
 primes_lower_than = primeslt
 
 
+_WHEEL_GAPS = (4, 2, 4, 2, 4, 6, 2, 6)
+_WHEEL_INDEX = {7: 0, 11: 1, 13: 2, 17: 3, 19: 4, 23: 5, 29: 6, 1: 7}
+_WHEEL_RESIDUES = sorted(_WHEEL_INDEX)
+
+
+class PrimeStream:
+    """
+    An unbounded, incremental sieve of eratosthenes yielding primes in ascending order
+    Candidates walk a mod-30 wheel, skipping the multiples of 2, 3, and 5
+    Each sieving prime only enters the dictionary of upcoming composites once the candidates reach its square
+    Streams are plain objects, so they can be pickled to checkpoint them and unpickled to carry on
+    :start:
+        resume from the first prime not below this value
+    eg
+        >>> stream = PrimeStream()
+        >>> [next(stream) for i in range(6)]
+        [2, 3, 5, 7, 11, 13]
+        >>> next(PrimeStream(start=100))
+        101
+    """
+
+    def __init__(self, start: Integral = 2):
+        self.pending = [p for p in (2, 3, 5, 7) if p >= start]
+        self.composites = {}
+        self.n, self.i = 7, 0
+        self.base = None
+        if start > 8:
+            block, residue = divmod(start - 1, 30)
+            k = bisect_right(_WHEEL_RESIDUES, residue) - 1
+            self.n = 30 * block + _WHEEL_RESIDUES[k] if k >= 0 else 30 * block - 1
+            self.i = _WHEEL_INDEX[self.n % 30]
+            self._postpone()
+            while self.q <= self.n:
+                m = max(self.p, -(-(self.n + 1) // self.p))
+                while m % 30 not in _WHEEL_INDEX:
+                    m += 1
+                self._mark(self.p * m, self.p, _WHEEL_INDEX[m % 30])
+                self.p = next(self.base)
+                self.q = self.p * self.p
+
+    def _postpone(self) -> None:
+        self.base = type(self)()
+        for _ in range(4):
+            self.p = next(self.base)
+        self.q = self.p * self.p
+
+    def _mark(self, n: Integral, p: Integral, j: Integral) -> None:
+        while n in self.composites:
+            n += p * _WHEEL_GAPS[j]
+            j = (j + 1) & 7
+        self.composites[n] = p, j
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> Integral:
+        if self.pending:
+            return self.pending.pop(0)
+        if self.base is None:
+            self._postpone()
+        composites = self.composites
+        n, i = self.n, self.i
+        while True:
+            n += _WHEEL_GAPS[i]
+            i = (i + 1) & 7
+            if n in composites:
+                p, j = composites.pop(n)
+                self._mark(n + p * _WHEEL_GAPS[j], p, (j + 1) & 7)
+            elif n < self.q:
+                self.n, self.i = n, i
+                return n
+            else:
+                j = _WHEEL_INDEX[self.p % 30]
+                self._mark(n + self.p * _WHEEL_GAPS[j], self.p, (j + 1) & 7)
+                self.p = next(self.base)
+                self.q = self.p * self.p
+
+
+def _segment(lo: Integral, hi: Integral) -> bytearray:
+    """
+    Sieve the half-open interval [lo, hi): the i-th byte of the result is 1 iff lo + i is prime
+    """
+    flags = bytearray([1]) * (hi - lo)
+    for p in primeslt(isqrt(hi - 1) + 1):
+        start = max(p * p, -(-lo // p) * p)
+        flags[start - lo :: p] = bytes(len(range(start - lo, hi - lo, p)))
+    for i in range(lo, min(hi, 2)):
+        flags[i - lo] = 0
+    return flags
+
+
+def nth_prime(n: Integral, segment: Integral = 1 << 20) -> Integral:
+    """
+    Return the n-th prime (counting from nth_prime(1) == 2)
+    The Rosser-Schoenfeld bounds n(ln n + ln ln n - 1) < p_n < n(ln n + ln ln n) pin down an interval,
+        the primes below it are counted with prime_pi, and only the interval itself is sieved segment by segment
+    """
+    if n < 1:
+        raise ValueError("primes are counted from 1")
+    if n < 6:
+        return (2, 3, 5, 7, 11)[n - 1]
+    lo = int(n * (log(n) + log(log(n)) - 1))
+    hi = _nth_prime_bound(n)
+    k = prime_pi(lo - 1)
+    for a in range(lo, hi, segment):
+        flags = _segment(a, min(a + segment, hi))
+        if k + (c := flags.count(1)) >= n:
+            i = -1
+            for _ in range(n - k):
+                i = flags.index(1, i + 1)
+            return a + i
+        k += c
+
+
+_POPCOUNT = bytes(bin(i).count("1") for i in range(256))
+
+
+@lru_cache(maxsize=2)
+def _prime_counter(limit: Integral) -> Callable:
+    """
+    An O(1) prime-counting function for 2 <= y < limit, from cumulative popcounts of the shared prime table
+    """
+    table = prime_table(limit + 16)
+    offset = table.header.size
+    bits = bytes(table._data[offset : offset + limit // 16 + 1])
+    counts = array("I", accumulate(bits.translate(_POPCOUNT), initial=0))
+    partial = bytes(_POPCOUNT[b & (1 << r) - 1] for b in range(256) for r in range(8))
+
+    def count_upto(y: Integral) -> Integral:
+        hi = (y + 1) >> 1
+        return 1 + counts[hi >> 3] + partial[bits[hi >> 3] << 3 | hi & 7]
+
+    return count_upto
+
+
+@lru_cache(maxsize=1)
+def _phi_tables() -> list:
+    """
+    For a = 1..7, the period P of the a-th primorial and the running count of the integers below each residue that no prime up to p_a divides
+    """
+    tables = [None]
+    P = 1
+    for p in (2, 3, 5, 7, 11, 13, 17):
+        P *= p
+        flags = bytearray([1]) * P
+        for q in (2, 3, 5, 7, 11, 13, 17)[: len(tables)]:
+            flags[::q] = bytes(len(range(0, P, q)))
+        tables.append((P, array("I", accumulate(flags, initial=0))))
+    return tables
+
+
+def _iroot(x: Integral, k: Integral) -> Integral:
+    r = int(x ** (1 / k))
+    while r**k > x:
+        r -= 1
+    while (r + 1) ** k <= x:
+        r += 1
+    return r
+
+
+def prime_pi(x: Integral) -> Integral:
+    """
+    Count the primes not exceeding x
+    Small counts are read off cumulative popcounts of the shared prime table, larger ones use Lehmer's formula
+        pi(x) = phi(x, a) + (b + a - 2)(b - a + 1)/2 - sum(pi(x/p_i) for a < i <= b) - sum(pi(x/(p_i*p_j)) - (j - 1) for a < i <= c, i <= j <= pi(sqrt(x/p_i)))
+        with a = pi(x**(1/4)), b = pi(x**(1/2)), c = pi(x**(1/3)),
+    where the partial sieve function phi comes from cached primorial tables and memoized recursion.
+    10**11 takes a couple of seconds, 10**12 about ten
+        >>> prime_pi(10**9)
+        50847534
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+    limit = min(1 << max(16, int(x ** (2 / 3)).bit_length()), prime_table().cap - 16)
+    count_upto = _prime_counter(limit)
+    if x < limit:
+        return count_upto(x)
+    primes = [0, *primeslt(isqrt(x) + 1)]
+    squares = [p * p for p in primes] + [x + 1]
+    tables = _phi_tables()
+    P7, T7 = tables[7]
+    phis, pis = {}, {}
+
+    def phi(y, a):
+        if a <= 7:
+            P, T = tables[a] if a else (1, (0, 1))
+            q, r = divmod(y, P)
+            return q * T[P] + T[r + 1]
+        if y <= primes[a]:
+            return int(y >= 1)
+        if y < limit and y < squares[a + 1]:
+            return count_upto(y) - a + 1
+        if (y, a) in phis:
+            return phis[y, a]
+        q, r = divmod(y, P7)
+        s = q * T7[P7] + T7[r + 1]
+        for k in range(8, a + 1):
+            z = y // primes[k]
+            if z <= primes[k - 1]:
+                s -= a - k + 1
+                break
+            s -= phi(z, k - 1)
+        phis[y, a] = s
+        return s
+
+    def lehmer(y):
+        if y < limit:
+            return count_upto(y)
+        if y in pis:
+            return pis[y]
+        a, b, c = lehmer(_iroot(y, 4)), lehmer(isqrt(y)), lehmer(_iroot(y, 3))
+        s = phi(y, a) + (b + a - 2) * (b - a + 1) // 2
+        for i in range(a + 1, b + 1):
+            w = y // primes[i]
+            s -= lehmer(w)
+            if i <= c:
+                bi = lehmer(isqrt(w))
+                s -= sum(map(lehmer, [w // p for p in primes[i : bi + 1]]))
+                s += (i + bi - 2) * (bi - i + 1) // 2
+        pis[y] = s
+        return s
+
+    return lehmer(x)
+
+
 def succ(n: Integral) -> Integral:
     """
     Returns the successor of the input number
@@ -74,29 +507,83 @@ def gcd0(a: Integral, b: Integral) -> Integral:
     """
     The famous euclidean algorithm for computing the greatest common divisor of a pair of numbers a and b
     """
-    while a != b:
-        if a > b:
-            a -= b
-        else:
-            b -= a
+    while b:
+        a, b = b, a % b
     return a
 
 
+def _gcd(iterable: Iterable[Integral]) -> Integral:
+    """
+    Left-reduce an iterable of integers with math.gcd, stopping as soon as the result is 1
+    """
+    g = 0
+    for i in iterable:
+        g = math.gcd(g, i)
+        if g == 1:
+            break
+    return g
+
+
 def gcd(*args: [int, tuple]) -> Integral:
     """
     Compute the gcd for more than two integers at a time. Returns input if only one argument is given and it is greater than zero
     """
     if any(i <= 0 for i in args):
         return None
-    if len(args) > 1:
-        gcds = {
-            d
-            for pair in combinations(args, 2)
-            if all(i % (d := gcd0(*pair)) == 0 for i in args)
-        }
-        return max(gcds) if gcds else 1
-    elif sum(args) > 0:
-        return max(args)
+    if args:
+        return _gcd(args)
+
+
+def lcm(*args: [int, tuple]) -> Integral:
+    """
+    Compute the least common multiple of any number of integers
+    """
+    return math.lcm(*args)
+
+
+def egcd(a: Integral, b: Integral) -> tuple:
+    """
+    Extended euclidean algorithm: returns (g, x, y) such that a*x + b*y == g == gcd(a, b)
+        >>> egcd(240, 46)
+        (2, -9, 47)
+    """
+    x0, x1, y0, y1 = 1, 0, 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    return (a, x0, y0) if a >= 0 else (-a, -x0, -y0)
+
+
+def modinv(a: Integral, modulus: Integral) -> Integral:
+    """
+    Compute the inverse of a modulo some modulus
+    Raises a ValueError if the two are not coprime
+    """
+    return pow(a, -1, modulus)
+
+
+def gcd_many(
+    a: Iterable[Integral], b: Iterable[Integral] | Integral
+) -> Iterable[Integral]:
+    """
+    Elementwise gcd of two equally long arrays of integers, or of an array and a single integer
+    NumPy arrays are handed to numpy.gcd, array.arrays come back as arrays of the same typecode, anything else as a list
+        >>> gcd_many([12, 9, 7], [18, 6, 5])
+        [6, 3, 1]
+    """
+    try:
+        import numpy
+
+        if isinstance(a, numpy.ndarray) or isinstance(b, numpy.ndarray):
+            return numpy.gcd(a, b)
+    except ImportError:
+        pass
+    result = map(math.gcd, a, _repeat(b) if isinstance(b, Integral) else b)
+    if isinstance(a, array):
+        return array(a.typecode, result)
+    return list(result)
 
 
 def eratosthenes(n: Integral, imaginarypart: bool = False) -> Generator:
@@ -123,69 +610,314 @@ def eratosthenes(n: Integral, imaginarypart: bool = False) -> Generator:
             yield i
 
 
-def _factors(n: Integral) -> Generator:
+def _pollard_brent(n: Integral) -> Integral:
     """
-    Compute the factors of an integer
+    Find a non-trivial factor of an odd composite integer with Brent's variant of Pollard's rho
     """
+    for c in count(1):
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(128, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += 128
+            r *= 2
+        if g == n:
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+
+def factorize(n: Integral) -> dict:
+    """
+    Compute the prime factorization of an integer as a {prime: exponent} dictionary
+    Small primes are divided out with the shared prime table, whatever is left is split with Pollard-Brent rho and isprime
+        >>> factorize(360)
+        {2: 3, 3: 2, 5: 1}
+    """
+    n = abs(int(n))
+    if not n:
+        raise ValueError("0 has no prime factorization")
+    exponents = {}
+    for p in primeslt(1 << 12):
+        if p * p > n:
+            break
+        if not n % p:
+            e = 0
+            while not n % p:
+                n //= p
+                e += 1
+            exponents[p] = e
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if isprime(m):
+            exponents[m] = exponents.get(m, 0) + 1
+        elif (r := isqrt(m)) * r == m:
+            stack += [r, r]
+        else:
+            d = _pollard_brent(m)
+            stack += [d, m // d]
+    return dict(sorted(exponents.items()))
 
-    def pipe(array):
-        return reduce(lambda x, y: x * y, array, 1)
 
-    primes = tuple(eratosthenes(n))
-    facts = {n, 1} if n != 0 else {}
-    for p in primes:
-        if n % p == 0:
-            e = 1
-            while n % p ** e == 0:
-                facts.add(p ** e)
-                e += 1
-    if facts == {n, 1}:
-        yield from facts
-    else:
-        for numbers in chain.from_iterable(
-            combinations(facts, r) for r in range(1, len(facts))
-        ):
-            if n % pipe(numbers) == 0:
-                facts.add(pipe(numbers))
-        yield from facts
+def _divisors(exponents: dict) -> list:
+    """
+    Expand a {prime: exponent} dictionary into the list of every divisor it describes
+    """
+    divisors = [1]
+    for p, e in exponents.items():
+        powers = [p**k for k in range(e + 1)]
+        divisors = [d * q for q in powers for d in divisors]
+    return divisors
+
+
+def _factors(n: Integral) -> Generator:
+    """
+    Compute the factors of an integer
+    """
+    if n:
+        yield from _divisors(factorize(n))
 
 
 def factors(*args: [int, tuple]) -> Generator:
     """
     Compute the common factors of any finite number of integers
+    These are the factors of their greatest common divisor
     """
-    args = regenerator(flat(args))
+    args = [*flat(args)]
     if all(isinstance(i, int) or i == int(i) for i in args):
-        yielded = set()
-        for i in args:
-            if not i in yielded:
-                for j in _factors(i):
-                    if not j in yielded:
-                        yielded.add(j)
-                        if all(not arg % j for arg in args):
-                            yield j
+        yield from _factors(_gcd(map(int, args)))
+
+
+_SPF_HEADER = struct.Struct("<8sQ")
+_SPF_MAGIC = b"sl4ngsp1"
+
+
+def _load_spf(path: str, n: Integral) -> memoryview | None:
+    """
+    Memory-map a smallest-prime-factor table written by spf_table, if the file holds one covering n
+    """
+    try:
+        with open(path, "rb") as fob:
+            data = mmap.mmap(fob.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    if len(data) < _SPF_HEADER.size:
+        return None
+    magic, limit = _SPF_HEADER.unpack_from(data)
+    end = _SPF_HEADER.size + array("I").itemsize * (limit + 1)
+    if magic != _SPF_MAGIC or limit < n or len(data) < end:
+        return None
+    return memoryview(data)[_SPF_HEADER.size : end].cast("I")
+
+
+def spf_table(n: Integral, path: str = None) -> array | memoryview:
+    """
+    Tabulate the smallest prime factor of every integer up to n in a compact array('I')
+    Primes, 0 and 1 are stored as 0, so the smallest prime factor of m <= n is "table[m] or m"
+    If a path is given the table is built there once, after a header recording its limit, and memory-mapped read-only on every later call
+    A file which lacks the header or covers less than n is rebuilt
+        >>> table = spf_table(100)
+        >>> table[91], table[97]
+        (7, 0)
+    """
+    if path and (loaded := _load_spf(path, n)) is not None:
+        return loaded
+    table = array("I", bytes(array("I").itemsize * (n + 1)))
+    for p in reversed([*primeslt(isqrt(n) + 1)]):
+        table[p * p :: p] = array("I", [p]) * len(range(p * p, n + 1, p))
+    if path:
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as fob:
+            fob.write(_SPF_HEADER.pack(_SPF_MAGIC, n))
+            table.tofile(fob)
+        os.replace(tmp, path)
+        loaded = _load_spf(path, n)
+        return table if loaded is None else loaded
+    return table
+
+
+def spf_factorize(n: Integral, table: array | memoryview) -> dict:
+    """
+    Factorize an integer covered by a smallest-prime-factor table in O(log n) steps
+    """
+    exponents = {}
+    while n > 1:
+        p = table[n] or n
+        n //= p
+        exponents[p] = exponents.get(p, 0) + 1
+    return exponents
+
+
+def _divisor_count(exponents: dict) -> Integral:
+    return reduce(lambda x, e: x * (e + 1), exponents.values(), 1)
+
+
+def _divisor_sum(exponents: dict) -> Integral:
+    return reduce(
+        lambda x, pe: x * (pe[0] ** (pe[1] + 1) - 1) // (pe[0] - 1),
+        exponents.items(),
+        1,
+    )
+
+
+def _spf_range(stop: Integral, start: Integral, table: array | memoryview) -> Generator:
+    table = spf_table(stop - 1) if table is None else table
+    for n in range(max(start, 1), stop):
+        yield spf_factorize(n, table)
+
+
+def factor_range(
+    stop: Integral, start: Integral = 1, table: array | memoryview = None
+) -> Generator:
+    """
+    Yield the list of factors of every integer in [start, stop), reading factorizations from a smallest-prime-factor table
+    One is built if none is given
+    """
+    for exponents in _spf_range(stop, start, table):
+        yield _divisors(exponents)
+
+
+def ndivisors_range(
+    stop: Integral, start: Integral = 1, table: array | memoryview = None
+) -> Generator:
+    """
+    Yield the number of factors of every integer in [start, stop), reading factorizations from a smallest-prime-factor table
+    """
+    yield from map(_divisor_count, _spf_range(stop, start, table))
+
+
+def sigma_range(
+    stop: Integral, start: Integral = 1, table: array | memoryview = None
+) -> Generator:
+    """
+    Yield the sum of the factors of every integer in [start, stop), reading factorizations from a smallest-prime-factor table
+    """
+    yield from map(_divisor_sum, _spf_range(stop, start, table))
+
+
+def sigma_sieve(n: Integral, aliquot: bool = False) -> array:
+    """
+    Tabulate the sum of the factors of every integer up to n in an array('Q'), in O(n log n)
+    Each divisor d <= sqrt(n) is paired with its cofactors, so every m is visited once per such divisor
+    :aliquot:
+        leave out the integer itself, giving the sum of its proper factors
+    eg
+        >>> sigma_sieve(6)
+        array('Q', [0, 1, 3, 4, 7, 6, 12])
+    """
+    sums = array("Q", bytes(8 * (n + 1)))
+    for d in range(1, isqrt(n) + 1):
+        sums[d * d] += d
+        k = d
+        for m in range(d * (d + 1), n + 1, d):
+            k += 1
+            sums[m] += d + k
+    if aliquot:
+        for m in range(n + 1):
+            sums[m] -= m
+    return sums
+
+
+def ndivisors_sieve(n: Integral) -> array:
+    """
+    Tabulate the number of factors of every integer up to n in an array('I'), in O(n log n)
+    """
+    counts = array("I", bytes(4 * (n + 1)))
+    for d in range(1, isqrt(n) + 1):
+        counts[d * d] += 1
+        for m in range(d * (d + 1), n + 1, d):
+            counts[m] += 2
+    return counts
 
 
-@lru_cache(maxsize=500)
 def factorial(n: Integral) -> Integral:
     """
     Return n! for any integer
+    Delegates to math.factorial, which multiplies the odd parts by binary splitting and shifts in the power of two at the end
     """
     if n >= 0:
-        k = 1
-        while n:
-            k *= n
-            n -= 1
-        return k
+        return math.factorial(n)
     else:
         return -factorial(abs(n))
 
 
+class _PascalRows(OrderedDict):
+    """
+    A least-recently-used cache of rows of Pascal's triangle whose budget is the total bit-length of the integers it holds rather than a number of rows
+    """
+
+    def __init__(self, budget: Integral):
+        super().__init__()
+        self.budget = budget
+        self.size = 0
+
+    def fetch(self, n: Integral) -> tuple:
+        if n in self:
+            self.move_to_end(n)
+            return self[n][0]
+
+    def store(self, n: Integral, row: tuple) -> tuple:
+        cost = sum(map(int.bit_length, row))
+        if cost <= self.budget:
+            self[n] = row, cost
+            self.size += cost
+            while self.size > self.budget:
+                self.size -= self.popitem(last=False)[1][1]
+        return row
+
+
+_pascal_rows = _PascalRows(1 << 24)
+
+
+def pascal(n: Integral) -> tuple:
+    """
+    Returns the n-th row of Pascal's triangle, keeping recent rows in a cache bounded by the number of bits they occupy
+        >>> pascal(4)
+        (1, 4, 6, 4, 1)
+    """
+    if (row := _pascal_rows.fetch(n)) is not None:
+        return row
+    row = [1]
+    for k in range(n):
+        row.append(row[-1] * (n - k) // (k + 1))
+    return _pascal_rows.store(n, tuple(row))
+
+
 def binomial(n: Integral, k: Integral) -> Integral:
     """
     Returns the n choose k for any k in range(n)
+    Exact for any size of n, reads from Pascal's triangle when that row has been cached
+    """
+    if not 0 <= k <= n:
+        return 0
+    if (row := _pascal_rows.fetch(n)) is not None:
+        return row[k]
+    return math.comb(n, k)
+
+
+def multinomial(*ks: Integral) -> Integral:
     """
-    return int(factorial(n) / (factorial(n - k) * factorial(k)))
+    Returns the multinomial coefficient (k1 + k2 + ...)! / (k1! * k2! * ...)
+        >>> multinomial(2, 1, 1)
+        12
+    """
+    result, total = 1, 0
+    for k in ks:
+        total += k
+        result *= math.comb(total, k)
+    return result
 
 
 def options(iterable: Iterable) -> Integral:
@@ -193,17 +925,29 @@ def options(iterable: Iterable) -> Integral:
     Returns the number of ways to choose elements from the given iterable
     This will consume a Generator
     """
-    consumable = regenerator(iterable)
-    length = sum(1 for i in consumable)
-    return sum(binomial(length, i) for i in range(length))
+    length = len(iterable) if hasattr(iterable, "__len__") else sum(1 for i in iterable)
+    return (1 << length) - 1
 
 
 def isHarmoDiv(n: Integral) -> bool:
     """
     Computes a boolean whose value corresponds to the statement 'the number n is a Harmonic Divisor Number'
+    The harmonic mean of the factors of n is n * d(n) / sigma(n), so it is read off n's factorization
     """
-    facts = factors(n)
-    return int(harmean(facts)) == harmean(facts)
+    if n < 1:
+        return False
+    exponents = factorize(n)
+    return not n * _divisor_count(exponents) % _divisor_sum(exponents)
+
+
+def harmodivs(stop: Integral, start: Integral = 1) -> Generator:
+    """
+    Yield the Harmonic Divisor Numbers in [start, stop), using divisor-count and divisor-sum sieves
+    """
+    counts, sums = ndivisors_sieve(stop - 1), sigma_sieve(stop - 1)
+    for n in range(max(start, 1), stop):
+        if not n * counts[n] % sums[n]:
+            yield n
 
 
 def isfactor(divisor: Integral, divisee: Integral) -> bool:
@@ -213,53 +957,310 @@ def isfactor(divisor: Integral, divisee: Integral) -> bool:
     return divisee % divisor == 0
 
 
+_SMALL_PRIMORIAL = reduce(
+    lambda x, y: x * y, (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47)
+)
+_MILLER_RABIN_BASES = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+
+
+def _strong_probable_prime(n: Integral, a: Integral) -> bool:
+    """
+    Miller-Rabin round: check that the odd integer n > 2 is a strong probable prime to base a
+    """
+    d = n - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+
+def _jacobi(a: Integral, n: Integral) -> Integral:
+    """
+    The Jacobi symbol (a/n) for odd positive n
+    """
+    a %= n
+    result = 1
+    while a:
+        while not a & 1:
+            a >>= 1
+            if n & 7 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a & 3 == 3 and n & 3 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+
+def _strong_lucas_probable_prime(n: Integral) -> bool:
+    """
+    Strong Lucas test with Selfridge's parameters, for odd n > 2 which is not a perfect square
+    """
+    D = 5
+    while (j := _jacobi(D, n)) != -1:
+        if j == 0:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d = n + 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+    U, V, Qk = 1, P, Q
+    for bit in bin(d)[3:]:
+        U, V, Qk = U * V % n, (V * V - 2 * Qk) % n, Qk * Qk % n
+        if bit == "1":
+            U, V = P * U + V, D * U + P * V
+            U, V = (U + n * (U & 1)) // 2 % n, (V + n * (V & 1)) // 2 % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V, Qk = (V * V - 2 * Qk) % n, Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
+
 def isprime(n: Integral) -> bool:
     """
     Confirm that an integer has no factors other than 1 and itself
+    Integers covered by the shared prime table are looked up, the rest go through a small-prime filter and then
+        deterministic Miller-Rabin below 2**64
+        Baillie-PSW above it (no known counterexamples)
     """
     if n < 2:
         return False
-    tried = []
-    for i in range(2, int(n / 2) + 1):
-        if any(not i % j for j in tried):
-            continue
-        else:
-            tried.append(i) if i > 1 else None
-            if not n % i:
-                return False
-    return True
+    if not isinstance(n, int) and (n := _as_int(n)) is None:
+        return False
+    if n < prime_table().limit:
+        return n in prime_table()
+    if math.gcd(n, _SMALL_PRIMORIAL) != 1:
+        return False
+    if n < 1 << 64:
+        return all(_strong_probable_prime(n, a) for a in _MILLER_RABIN_BASES if a % n)
+    if isqrt(n) ** 2 == n:
+        return False
+    return _strong_probable_prime(n, 2) and _strong_lucas_probable_prime(n)
+
+
+def _isprime_chunk(numbers: list) -> bytes:
+    return bytes(map(isprime, numbers))
+
+
+def isprime_many(
+    numbers: Iterable[Integral],
+    processes: Integral = None,
+    chunksize: Integral = 1 << 12,
+) -> Generator:
+    """
+    Yield isprime(n) for each of the given numbers, in order, spreading chunks of them over a pool of processes
+    Each worker maps the shared prime table rather than building its own, and answers with one byte per number
+    Use processes=1 to stay in the calling process
+    """
+    numbers = iter(numbers)
+    chunks = iter(lambda: list(islice(numbers, chunksize)), [])
+    if processes == 1:
+        for chunk in chunks:
+            yield from map(bool, _isprime_chunk(chunk))
+        return
+    with ProcessPoolExecutor(processes) as pool:
+        for flags in pool.map(_isprime_chunk, chunks):
+            yield from map(bool, flags)
+
+
+def _screen_chunk(
+    func: Callable, start: Integral, stop: Integral, kernel: bool, output: str
+) -> tuple:
+    flags = func(start, stop) if kernel else bytes(map(func, range(start, stop)))
+    if output == "bits":
+        return start, _pack_bits(bytes(map(bool, flags)))
+    if output == "indices":
+        return start, array("Q", (start + i for i, flag in enumerate(flags) if flag))
+    return start, bytes(flags)
+
+
+def screen(
+    func: Callable,
+    stop: Integral,
+    start: Integral = 0,
+    processes: Integral = None,
+    chunksize: Integral = 1 << 16,
+    ordered: bool = True,
+    output: str = "mask",
+    kernel: bool = False,
+) -> Generator:
+    """
+    Evaluate a number-theoretic predicate over every integer in [start, stop) on a pool of processes
+    The interval is cut into cache-sized chunks and a (chunk start, result) pair is yielded per chunk
+    :func:
+        a picklable callable, eg isprime, isperfect, mulper, or functools.partial(congrues, modulus=4)
+        its results are stored as bytes, so they must be booleans or integers below 256
+        it must accept every integer in the interval, which rules out isfilial unless start is at least 1
+    :kernel:
+        func takes a whole chunk, func(start, stop), and returns one flag per integer, as a sieve would
+    :output:
+        "mask" -> one byte per integer
+        "bits" -> a packed bitmask, bit i of the chunk's bytes describes chunk start + i
+        "indices" -> an array('Q') of the integers whose result is truthy
+    :ordered:
+        yield chunks in ascending order, rather than as soon as they complete
+    :processes:
+        size of the pool, use 1 to stay in the calling process
+    At most two chunks per process are in flight at once, so a slow consumer holds back the pool rather than piling up results
+    eg
+        >>> sum(len(i) for _, i in screen(isprime, 10**6, output="indices"))
+        78498
+    """
+    if output not in ("mask", "bits", "indices"):
+        raise ValueError(f'output must be "mask", "bits", or "indices", not {output!r}')
+    bounds = ((a, min(a + chunksize, stop)) for a in range(start, stop, chunksize))
+    if processes == 1:
+        for a, b in bounds:
+            yield _screen_chunk(func, a, b, kernel, output)
+        return
+    window = 2 * (processes or os.cpu_count() or 1)
+    with ProcessPoolExecutor(processes) as pool:
+        submit = lambda a, b: pool.submit(_screen_chunk, func, a, b, kernel, output)
+        if ordered:
+            futures = deque(submit(a, b) for a, b in islice(bounds, window))
+            while futures:
+                result = futures.popleft().result()
+                futures.extend(submit(a, b) for a, b in islice(bounds, 1))
+                yield result
+            return
+        pending = {submit(a, b) for a, b in islice(bounds, window)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= {submit(a, b) for a, b in islice(bounds, len(done))}
+            for future in done:
+                yield future.result()
 
 
 def isperfect(n: Integral) -> bool:
     """
-    Check if an integer is equal to the sum of its factors
+    Check if an integer is equal to the sum of its proper factors
     """
-    return n == sum(factors(n))
+    return n > 0 and _divisor_sum(factorize(n)) == 2 * n
 
 
 def isabundant(n: Integral) -> bool:
     """
-    Check if an integer is greater than the sum of its factors
+    Check if an integer is smaller than the sum of its proper factors
     """
-    from .iteration import sigma
-
-    return n > sigma(factors(n))
+    return n > 0 and _divisor_sum(factorize(n)) > 2 * n
 
 
 def isdeficient(n: Integral) -> bool:
     """
-    Check if an integer is smaller than the sum of its factors
+    Check if an integer is greater than the sum of its proper factors
+    """
+    return n > 0 and _divisor_sum(factorize(n)) < 2 * n
+
+
+def classify(stop: Integral, start: Integral = 1) -> tuple:
+    """
+    Sort every integer in [start, stop) into perfect, abundant, or deficient numbers with one divisor-sum sieve
+    Returns three bytearray masks (perfect, abundant, deficient) whose i-th byte describes start + i
+    """
+    start = max(start, 1)
+    sums = sigma_sieve(stop - 1)
+    masks = tuple(bytearray(max(stop - start, 0)) for i in range(3))
+    perfect, abundant, deficient = masks
+    for i, n in enumerate(range(start, stop)):
+        if (s := sums[n]) > 2 * n:
+            abundant[i] = 1
+        elif s < 2 * n:
+            deficient[i] = 1
+        else:
+            perfect[i] = 1
+    return masks
+
+
+def perfects(stop: Integral, start: Integral = 1) -> Generator:
+    """
+    Yield the perfect numbers in [start, stop)
+    """
+    start = max(start, 1)
+    yield from (start + i for i, b in enumerate(classify(stop, start)[0]) if b)
+
+
+def abundants(stop: Integral, start: Integral = 1) -> Generator:
+    """
+    Yield the abundant numbers in [start, stop)
+    """
+    start = max(start, 1)
+    yield from (start + i for i, b in enumerate(classify(stop, start)[1]) if b)
+
+
+def deficients(stop: Integral, start: Integral = 1) -> Generator:
+    """
+    Yield the deficient numbers in [start, stop)
     """
-    from .iteration import sigma
+    start = max(start, 1)
+    yield from (start + i for i, b in enumerate(classify(stop, start)[2]) if b)
 
-    return n < sigma(factors(n))
+
+_BLOCK = 10**4
+_BLOCK_SUMS = bytes(sum(map(int, str(b))) for b in range(_BLOCK))
+_BLOCK_PRODUCTS = array(
+    "H", (reduce(lambda x, y: x * y, map(int, str(b))) for b in range(_BLOCK))
+)
+_PADDED_PRODUCTS = array(
+    "H", (p if b >= _BLOCK // 10 else 0 for b, p in enumerate(_BLOCK_PRODUCTS))
+)
+
+
+def _digits(n: Real) -> Integral:
+    """
+    Strip the sign and decimal point from a number, leaving a non-negative integer with the same digits
+    """
+    return abs(n) if isinstance(n, int) else int(str(abs(n)).replace(".", ""))
+
+
+def digit_sum(n: Integral) -> Integral:
+    """
+    Sum the base-10 digits of an integer, four at a time
+    """
+    n, s = abs(n), 0
+    while n >= _BLOCK:
+        n, r = divmod(n, _BLOCK)
+        s += _BLOCK_SUMS[r]
+    return s + _BLOCK_SUMS[n]
+
+
+def digit_product(n: Integral) -> Integral:
+    """
+    Multiply the base-10 digits of an integer, four at a time
+    """
+    n, p = abs(n), 1
+    while n >= _BLOCK:
+        n, r = divmod(n, _BLOCK)
+        if not (p := p * _PADDED_PRODUCTS[r]):
+            return 0
+    return p * _BLOCK_PRODUCTS[n]
 
 
 def isfilial(n: Integral) -> bool:
     """
     Check if an integer is divisible by the sum of its digits
     """
-    return not n % sum(eval(i) for i in str(n))
+    return not n % digit_sum(n)
+
+
+@lru_cache(maxsize=1 << 16)
+def _mulper(n: Integral) -> Integral:
+    return 0 if n < 10 else 1 + _mulper(digit_product(n))
+
+
+@lru_cache(maxsize=1 << 16)
+def _addper(n: Integral) -> Integral:
+    return 0 if n < 10 else 1 + _addper(digit_sum(n))
 
 
 def mulper(n: Integral) -> Integral:
@@ -267,46 +1268,89 @@ def mulper(n: Integral) -> Integral:
     Computes the Multiplicative Persistence of an int or float in base-10 positional notation
     If the number is a float the decimal will be removed
     """
-    # Exclusions
-    if len(str(n)) == 1:
-        return 0
-    elif (str(0) in str(n)) or ((len(str(n)) == 2) and (str(1) in str(n))):
-        return 1
-    else:
-        ctr = 0
-        while len(str(n)) > 1:
-            # digitList = [int(i) for i in "".join(str(n).split('.'))]
-            digitList = map(int, str(i).replace(".", ""))
-            n = reduce(lambda x, y: x * y, digitList, 1)
-            ctr += 1
-        return ctr
+    return _mulper(_digits(n))
 
 
 def addper(n: Integral) -> Integral:
     """
     Computes the Additive Persistence of an int or float in base-10 positional notation
     """
-    if len(str(n)) == 1:
-        return 0
-    elif len(str(n)) < 1:
-        return ValueError("Your number of choice has less than one digit")
-    else:
-        ctr = 0
-        while len(str(n)) > 1:
-            digitList = [int(i) for i in "".join(str(n).split("."))]
-            n = sum(digitList)
-            ctr += 1
-        return ctr
+    return _addper(_digits(n))
+
+
+def _range_blocks(stop: Integral, start: Integral) -> Generator:
+    """
+    Split [start, stop) into (high part, low slice) pairs, one per block of ten thousand consecutive integers
+    """
+    for hi in range(start // _BLOCK, (stop - 1) // _BLOCK + 1):
+        yield hi, slice(max(start - hi * _BLOCK, 0), min(stop - hi * _BLOCK, _BLOCK))
+
+
+def digit_sums(stop: Integral, start: Integral = 0) -> Generator:
+    """
+    Yield the digit sum of every integer in [start, stop), reusing the sum of the higher digits across each block
+    """
+    for hi, low in _range_blocks(stop, max(start, 0)):
+        base = digit_sum(hi)
+        yield from (base + s for s in _BLOCK_SUMS[low])
+
+
+def digit_products(stop: Integral, start: Integral = 0) -> Generator:
+    """
+    Yield the digit product of every integer in [start, stop), reusing the product of the higher digits across each block
+    """
+    for hi, low in _range_blocks(stop, max(start, 0)):
+        if hi:
+            base = digit_product(hi)
+            yield from (base * p for p in _PADDED_PRODUCTS[low])
+        else:
+            yield from _BLOCK_PRODUCTS[low]
+
+
+def mulpers(stop: Integral, start: Integral = 0) -> array:
+    """
+    Tabulate the multiplicative persistence of every integer in [start, stop) in an array('B')
+    """
+    start = max(start, 0)
+    return array(
+        "B",
+        (
+            0 if n < 10 else 1 + _mulper(p)
+            for n, p in zip(range(start, stop), digit_products(stop, start))
+        ),
+    )
+
+
+def addpers(stop: Integral, start: Integral = 0) -> array:
+    """
+    Tabulate the additive persistence of every integer in [start, stop) in an array('B')
+    """
+    start = max(start, 0)
+    return array(
+        "B",
+        (
+            0 if n < 10 else 1 + _addper(s)
+            for n, s in zip(range(start, stop), digit_sums(stop, start))
+        ),
+    )
+
+
+def filials(stop: Integral, start: Integral = 1) -> bytearray:
+    """
+    Mark which integers in [start, stop) are divisible by the sum of their digits (Harshad numbers)
+    The i-th byte of the result describes start + i
+    """
+    start = max(start, 1)
+    return bytearray(
+        not n % s for n, s in zip(range(start, stop), digit_sums(stop, start))
+    )
 
 
 def triangular(a: Integral, b: Integral) -> Integral:
     """
     Returns the triangular number of the closed interval [a,b]
     """
-    interval = [i for i in range(b) if i > a]
-    for num in interval:
-        a += num
-    return a + b
+    return ArithmeticProgression(a, 1, b - a + 1).sum() if a < b else a + b
 
 
 def rationability(v: Complex) -> Complex:
@@ -337,28 +1381,197 @@ def root(value: Complex, power: Complex = 2) -> Complex:
     return value ** (1 / power)
 
 
-def odds(n: Integral = -1) -> Generator:
+class _Progression:
     """
-    Yield the first n odd numbers, use a negative value for all of them
+    Shared indexing for progressions whose n-th term has a closed form
+    A length of None makes the progression infinite
     """
-    ctr = count()
-    while n:
-        m = next(ctr)
-        if m % 2:
-            yield m
-            n -= 1
+
+    def __init__(self, first: Number, difference: Number, length: Integral = None):
+        self.first = first
+        self.difference = difference
+        self.length = None if length is None else max(int(length), 0)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.first!r}, {self.difference!r}, {self.length!r})"
+
+    def __len__(self) -> Integral:
+        if self.length is None:
+            raise TypeError(f"{type(self).__name__} is infinite")
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length != 0
+
+    def __eq__(self, other: "_Progression") -> bool:
+        if not isinstance(other, _Progression):
+            return NotImplemented
+        if self.length != other.length:
+            return False
+        if not self:
+            return True
+        if self.length == 1:
+            return self.first == other.first
+        return (type(self), self.first, self.difference) == (
+            type(other),
+            other.first,
+            other.difference,
+        )
+
+    def __iter__(self) -> Generator:
+        return islice(self._terms(), self.length)
+
+    def __getitem__(self, index: Integral | slice) -> Number:
+        if isinstance(index, slice):
+            if self.length is not None:
+                indices = range(self.length)[index]
+                return self._slice(indices.start, indices.step, len(indices))
+            start, stop, step = index.start or 0, index.stop, index.step or 1
+            if start < 0 or step < 0 or (stop is not None and stop < 0):
+                raise IndexError("infinite progressions cannot be indexed from the end")
+            length = None if stop is None else len(range(start, stop, step))
+            return self._slice(start, step, length)
+        if self.length is not None:
+            index = range(self.length)[index]
+        elif index < 0:
+            raise IndexError("infinite progressions cannot be indexed from the end")
+        return self._term(index)
+
+    def to_array(self, typecode: str = "q") -> array:
+        """
+        Materialize the progression into an array.array of the given typecode
+        """
+        if self.length is None:
+            raise TypeError(f"{type(self).__name__} is infinite")
+        return array(typecode, self)
+
+
+class ArithmeticProgression(_Progression):
+    """
+    The sequence first, first + difference, first + 2*difference, ..., with O(1) len, indexing, slicing, membership, and sum
+        >>> odds = ArithmeticProgression(1, 2)
+        >>> odds[10**9], 15 in odds, odds[:5].sum()
+        (2000000001, True, 25)
+    """
+
+    def _term(self, index: Integral) -> Number:
+        return self.first + index * self.difference
+
+    def _terms(self) -> Generator:
+        return count(self.first, self.difference)
+
+    def _slice(
+        self, start: Integral, step: Integral, length: Integral
+    ) -> "ArithmeticProgression":
+        return type(self)(self._term(start), self.difference * step, length)
+
+    def __contains__(self, value: Number) -> bool:
+        if not self:
+            return False
+        if not self.difference:
+            return value == self.first
+        index, remainder = divmod(value - self.first, self.difference)
+        return (
+            not remainder
+            and index >= 0
+            and (self.length is None or index < self.length)
+        )
+
+    def sum(self) -> Number:
+        """
+        The sum of every term, by Gauss' pairing
+        """
+        n = len(self)
+        return n * self.first + self.difference * (n * (n - 1) // 2)
+
+    def to_array(self, typecode: str = "q") -> array:
+        if (
+            isinstance(self.first, int)
+            and isinstance(self.difference, int)
+            and self.difference
+        ):
+            return array(
+                typecode, range(self.first, self._term(len(self)), self.difference)
+            )
+        return super().to_array(typecode)
+
+
+class GeometricProgression(_Progression):
+    """
+    The sequence first, first * ratio, first * ratio**2, ..., with O(1) len, indexing, slicing, and sum
+    Iteration multiplies by the ratio rather than recomputing powers
+        >>> doubles = GeometricProgression(3, 2)
+        >>> doubles[10], 96 in doubles, doubles[:4].sum()
+        (3072, True, 45)
+    """
+
+    @property
+    def ratio(self) -> Number:
+        return self.difference
+
+    def _term(self, index: Integral) -> Number:
+        return self.first * self.ratio**index
+
+    def _terms(self) -> Generator:
+        term, ratio = self.first, self.ratio
+        while True:
+            yield term
+            term *= ratio
+
+    def _slice(
+        self, start: Integral, step: Integral, length: Integral
+    ) -> "GeometricProgression":
+        return type(self)(self._term(start), self.ratio**step, length)
+
+    def __contains__(self, value: Number) -> bool:
+        first, ratio = self.first, self.ratio
+        if not self:
+            return False
+        if not first or ratio in (0, 1, -1):
+            return value in tuple(islice(self, 2))
+        if not value or value != value or abs(value) == math.inf:
+            # no term of a nonzero progression is zero, infinite, or nan, though floats may underflow or overflow to one
+            return False
+        if abs(ratio) == 1:
+            # terms keep their magnitude, so the scan below would never stop; only ±1j cycles exactly, in four steps
+            return value in tuple(islice(self, 4))
+        shrinking = abs(ratio) < 1
+        for term in self:
+            if term == value:
+                return True
+            if (abs(term) < abs(value)) if shrinking else (abs(term) > abs(value)):
+                return False
+        return False
+
+    def sum(self) -> Number:
+        """
+        The sum of every term; infinite progressions converge when the ratio lies strictly between -1 and 1
+        """
+        first, ratio = self.first, self.ratio
+        if self.length is None:
+            if abs(ratio) < 1:
+                return first / (1 - ratio)
+            raise ValueError("the series diverges")
+        if ratio == 1:
+            return first * self.length
+        numerator = first * (ratio**self.length - 1)
+        if all(isinstance(i, int) for i in (first, ratio)):
+            return numerator // (ratio - 1)
+        return numerator / (ratio - 1)
+
+
+def odds(n: Integral = -1) -> ArithmeticProgression:
+    """
+    The first n odd numbers, use a negative value for all of them
+    """
+    return ArithmeticProgression(1, 2, n if n >= 0 else None)
 
 
-def evens(n: Integral = -1) -> Generator:
+def evens(n: Integral = -1) -> ArithmeticProgression:
     """
-    Yield the first n even numbers, use a negative value for all of them
+    The first n even numbers, use a negative value for all of them
     """
-    ctr = count()
-    while n:
-        m = next(ctr)
-        if not m % 2:
-            yield m
-            n -= 1
+    return ArithmeticProgression(0, 2, n if n >= 0 else None)
 
 
 def congrues(n: Integral, modulus: Integral = 6, cls: Integral = 1) -> bool:
@@ -374,14 +1587,13 @@ def mulseq(
     terms: Integral = -1,
     start: Integral = 0,
     step: Integral = 1,
-) -> Generator:
+) -> GeometricProgression:
     """
     Generate a sequence of multiples of a root and a base. By default it will yield the doubles sequence of the root.
     """
-    counter = count(start=start, step=step)
-    while terms:
-        yield root * base ** next(counter)
-        terms -= 1
+    return GeometricProgression(
+        root * base**start, base**step, terms if terms >= 0 else None
+    )
 
 
 if __name__ == "__main__":
@@ -1,21 +1,139 @@
-from typing import Any, Iterable
-from math import log
+from typing import Any, Callable, Generator, Iterable
+from array import array
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from decimal import Decimal
+from fractions import Fraction
+from math import ceil, fsum, log
+from numbers import Integral, Number, Real
 from functools import lru_cache, reduce
-from itertools import tee
+from hashlib import blake2b
+from heapq import heappop, heappush
+from itertools import accumulate, chain, islice, tee
+from operator import mul
+from statistics import NormalDist
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+import warnings
 
 from .strings import alphabet
-from .iteration import regenerator, sigma
+from .iteration import regenerator, sample, sigma
 
 # from .types import regurge
 
 
-def shannonEntropy(iterable: Iterable[Any]) -> float:
+def _byte_counts(data: bytes) -> list:
+    """
+    A 256-bin histogram of the byte values in a bytes-like object
+    """
+    try:
+        import numpy
+
+        return numpy.bincount(
+            numpy.frombuffer(data, numpy.uint8), minlength=256
+        ).tolist()
+    except ImportError:
+        counts = [0] * 256
+        for byte, n in Counter(memoryview(data).cast("B")).items():
+            counts[byte] = n
+        return counts
+
+
+def _entropy(counts: Iterable[int], base: float = 2) -> float:
+    """
+    The entropy of a frequency distribution: log(N) - sum(c*log(c))/N, for N the total count
+    """
+    counts = [c for c in counts if c]
+    total = sum(counts)
+    if not total:
+        return 0.0
+    return (log(total) - fsum(c * log(c) for c in counts) / total) / log(base)
+
+
+def shannonEntropy(iterable: Iterable[Any], base: float = 2) -> float:
     """
     Returns the Information, or Shannon, Entropy of an iterable
+    Symbols are tallied in a single pass, bytes-like input goes through a 256-bin histogram
     """
-    consumable = regenerator(iterable)
-    weights = {j: freq(j, iterable) / len(consumable) for j in set(consumable)}
-    return -sigma([val * log(val, 2) for val in weights.values()])
+    if isinstance(iterable, (bytes, bytearray, memoryview)):
+        return _entropy(_byte_counts(iterable), base)
+    return _entropy(Counter(iterable).values(), base)
+
+
+def byte_entropy(chunks: Iterable[bytes], base: float = 2) -> float:
+    """
+    Returns the Shannon entropy of a stream of bytes-like chunks, holding only a 256-bin histogram in memory
+    """
+    counts = [0] * 256
+    for chunk in chunks:
+        counts = [a + b for a, b in zip(counts, _byte_counts(chunk))]
+    return _entropy(counts, base)
+
+
+def file_entropy(path: str, base: float = 2, chunksize: int = 1 << 24) -> float:
+    """
+    Returns the Shannon entropy of a file's bytes, read chunk by chunk through a memory map
+    """
+    with open(path, "rb") as fob:
+        if not os.fstat(fob.fileno()).st_size:
+            return 0.0
+        with mmap.mmap(fob.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            view = memoryview(data)
+            try:
+                return byte_entropy(
+                    (view[i : i + chunksize] for i in range(0, len(view), chunksize)),
+                    base,
+                )
+            finally:
+                view.release()
+
+
+def entropy_profile(
+    data: bytes, window: int = 4096, step: int = 256, base: float = 2
+) -> Generator:
+    """
+    Yield (offset, entropy) for every full window of a bytes-like object (bytes, bytearray, memoryview, mmap), offsets advancing by step
+    The window's byte counts and running sum of c*log(c) are adjusted for each byte that leaves and enters it,
+    using a precomputed table of c*log(c), so each one-byte slide costs O(1) instead of O(window)
+    """
+    if window < 1 or step < 1:
+        raise ValueError("window and step must be positive")
+    nlogn = [0.0] + [c * log(c) for c in range(1, window + 1)]
+    scale, logw = 1 / log(base), log(window)
+    counts = [0] * 256
+    for byte in data[:window]:
+        counts[byte] += 1
+    total = fsum(nlogn[c] for c in counts)
+    for offset in range(0, len(data) - window + 1, step):
+        yield offset, (logw - total / window) * scale
+        leaving = data[offset : offset + step]
+        entering = data[offset + window : offset + window + step]
+        if len(entering) < step:
+            break
+        for a, b in zip(leaving, entering):
+            if a != b:
+                ca, cb = counts[a], counts[b]
+                total += nlogn[ca - 1] - nlogn[ca] + nlogn[cb + 1] - nlogn[cb]
+                counts[a], counts[b] = ca - 1, cb + 1
+        if offset % (1 << 20) < step:
+            total = fsum(nlogn[c] for c in counts)
+
+
+def entropy_curve(
+    data: bytes, window: int = 4096, step: int = 256, base: float = 2
+) -> array:
+    """
+    Collect the entropies from entropy_profile into an array('d'), one per window
+    """
+    return array("d", (h for _, h in entropy_profile(data, window, step, base)))
 
 
 def entropy(
@@ -24,47 +142,34 @@ def entropy(
     """
     Computes a modal entropy for a given iterable. Ints and floats will be converted to strings. Comma format ints will raise errors.
     Space determines the character you wish to interpret as space if inpt is a string
+    Modes:
+        "kbdUS" -> count the symbols found on a US keyboard
+        "abc" -> count letters and spaces
+        "num" -> count digits, decimal points, and minus signs
+        "shan" -> count every element as it is, see shannonEntropy
+    Elements which are not strings are converted to strings, and every one of their characters is counted
+    Probabilities are taken relative to the number of symbols counted
     """
     abc = alphabet
     letters = "".join(i for i in abc if i.isalpha() or i == " ")
     digits = "".join(i for i in abc if i.isnumeric() or i == "." or i == "-")
 
-    def prob(x, y):
-        return freq(x, y) / len(y)
-
-    consumable = regenerator(iterable)
-
-    iterates = hasattr(consumable, "__iter__")
-
-    if mode == "kbdUS":
-        consumable = (
-            str(consumable) if not iterates else tuple(str(i) for i in consumable)
-        )
-        chars = abc if space == None else abc
-        weights = {i: prob(i, chars) for i in set(consumable)}
-        return -sigma(val * log(val, base) for val in weights.values())
-
-    elif mode == "abc":
-        consumable = (
-            str(consumable) if not iterates else tuple(str(i) for i in consumable)
-        )
-        chars = letters if space == None else abc
-        weights = {i: prob(i, chars) for i in set(consumable)}
-        return -sigma(val * log(val, base) for val in weights.values())
-
-    elif mode == "num":
-        consumable = (
-            str(consumable) if not iterates else tuple(str(i) for i in consumable)
-        )
-        chars = digits if space == None else abc
-        weights = {i: prob(i, chars) for i in set(consumable)}
-        return -sigma(val * log(val, base) for val in weights.values())
-
-    elif mode == "shan":
-        consumable = str(consumable) if not iterates else consumable
-        chars = tuple(i for i in consumable)
-        weights = {i: prob(i, chars) for i in set(consumable)}
-        return -sigma(val * log(val, base) for val in weights.values())
+    if not hasattr(iterable, "__iter__"):
+        iterable = str(iterable)
+    if mode == "shan":
+        return shannonEntropy(iterable, base)
+    chars = {"kbdUS": abc, "abc": letters, "num": digits}.get(mode)
+    if chars is None:
+        raise ValueError(f'mode must be "kbdUS", "abc", "num", or "shan", not {mode!r}')
+    chars = set(chars)
+    symbols = (
+        iterable
+        if isinstance(iterable, str)
+        else chain.from_iterable(map(str, iterable))
+    )
+    if space is not None:
+        symbols = (" " if i == space else i for i in symbols)
+    return _entropy(Counter(i for i in symbols if i in chars).values(), base)
 
 
 def probability(item: Any, iterable: Iterable) -> float:
@@ -72,71 +177,1164 @@ def probability(item: Any, iterable: Iterable) -> float:
     Returns the quotient of the frequency with which an item
     occurs in an iterable by the length of said iterable
     """
-    consumable = regenerator(iterable)
-    return freq(item, consumable) / len(consumable)
+    return FrequencyTable(iterable).probability(item)
 
 
 def freq(element: Any, iterable: Iterable[Any], overlap: bool = False) -> int:
     """
     Returns the number of appearences of some term in some collection
+    Substrings of str/bytes are counted by str.count, or with overlap by repeated find
     :: greedy ::
         handy for scanning sequences of digits in an integer:
             say you're looking for 00 and there's a "000"
             you may only get one of what could be two matches
     """
-    consumable = regenerator(iterable)
-    if type(element) == type(consumable) == str:
+    bytelike = (bytes, bytearray, memoryview)
+    if (isinstance(iterable, str) and isinstance(element, str)) or (
+        isinstance(iterable, bytelike[:2]) and isinstance(element, bytelike)
+    ):
+        if not element:
+            return len(iterable) + 1
         if not overlap:
-            return len(consumable.split(element)) - 1
+            return iterable.count(element)
+        total, position = 0, iterable.find(element)
+        while position >= 0:
+            total += 1
+            position = iterable.find(element, position + 1)
+        return total
+    return sum(1 for i in iterable if i == element)
+
+
+class AhoCorasick:
+    """
+    An Aho-Corasick automaton which counts the occurrences of many substrings in a single pass over a text
+    Patterns are all str or all bytes; the text may arrive in chunks, which are free to cut across matches
+    :overlap:
+        if False, each pattern's count agrees with text.count(pattern): a match is skipped if it overlaps the previous match of the same pattern
+    eg
+        >>> AhoCorasick(["he", "she", "hers"]).count("ushers")
+        Counter({'she': 1, 'he': 1, 'hers': 1})
+        >>> AhoCorasick(["aa"]).count("aaaa", overlap=True)
+        Counter({'aa': 3})
+    """
+
+    def __init__(self, patterns: Iterable[str | bytes]):
+        self.patterns = list(dict.fromkeys(patterns))
+        if not all(self.patterns):
+            raise ValueError("patterns must be non-empty")
+        goto, fail, out = [{}], [0], [()]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for symbol in pattern:
+                if symbol not in goto[state]:
+                    goto[state][symbol] = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    out.append(())
+                state = goto[state][symbol]
+            out[state] += (index,)
+        queue = list(goto[0].values())
+        for state in queue:
+            for symbol, child in goto[state].items():
+                queue.append(child)
+                f = fail[state]
+                while f and symbol not in goto[f]:
+                    f = fail[f]
+                fail[child] = goto[f].get(symbol, 0) if state else 0
+                out[child] += out[fail[child]]
+        self.goto, self.fail, self.out = goto, fail, out
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self.patterns)} patterns, {len(self.goto)} states)"
+
+    def finditer(self, chunks: Iterable[str | bytes]) -> Generator:
+        """
+        Yield the (start, pattern) of every match, overlapping ones included, in order of their ends
+        """
+        goto, fail, out, patterns = self.goto, self.fail, self.out, self.patterns
+        state = offset = 0
+        for chunk in chunks:
+            for position, symbol in enumerate(chunk, offset + 1):
+                while state and symbol not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(symbol, 0)
+                for index in out[state]:
+                    yield position - len(patterns[index]), patterns[index]
+            offset += len(chunk)
+
+    def count(
+        self, source: str | bytes | Iterable[str | bytes], overlap: bool = False
+    ) -> Counter:
+        """
+        Count the matches of every pattern in a text, or an iterable of chunks of one
+        """
+        chunks = (
+            [source]
+            if isinstance(source, (str, bytes, bytearray, memoryview))
+            else source
+        )
+        counts = Counter()
+        if overlap:
+            goto, fail, out = self.goto, self.fail, self.out
+            hits = [0] * len(goto)
+            state = 0
+            for chunk in chunks:
+                for symbol in chunk:
+                    while state and symbol not in goto[state]:
+                        state = fail[state]
+                    state = goto[state].get(symbol, 0)
+                    hits[state] += 1
+            for state, n in enumerate(hits):
+                for index in out[state] if n else ():
+                    counts[self.patterns[index]] += n
+            return counts
+        free = dict.fromkeys(self.patterns, 0)
+        for start, pattern in self.finditer(chunks):
+            if start >= free[pattern]:
+                counts[pattern] += 1
+                free[pattern] = start + len(pattern)
+        return counts
+
+    def count_file(
+        self, path: str, overlap: bool = False, chunksize: int = 1 << 20
+    ) -> Counter:
+        """
+        Count the matches of every (bytes) pattern in a file, read in chunks of the given size
+        """
+        with open(path, "rb") as file:
+            return self.count(iter(lambda: file.read(chunksize), b""), overlap)
+
+
+def count_patterns(
+    patterns: Iterable[str | bytes],
+    source: str | bytes | Iterable[str | bytes],
+    overlap: bool = False,
+) -> Counter:
+    """
+    Count the occurrences of each of many substrings in a text, or an iterable of its chunks, in one pass
+    eg
+        >>> count_patterns(["00", "01"], "10001", overlap=True)
+        Counter({'00': 2, '01': 1})
+    """
+    return AhoCorasick(patterns).count(source, overlap)
+
+
+class FrequencyTable:
+    """
+    A table of how often each value occurs in a collection, built in one pass and queried as often as needed
+    Hashable values are counted as they are; with a bin width, numbers are counted in the bins [origin + i*width, origin + (i+1)*width) and stand for their bins' midpoints
+    Tables with the same binning can be merged, so shards may be tabulated separately
+    eg
+        >>> table = FrequencyTable("mississippi")
+        >>> table.mode(), table.pmf("s"), table.cdf("m")
+        ('i', 0.36363636363636365, 0.45454545454545453)
+        >>> FrequencyTable([0.1, 0.4, 1.2], width=1).items()
+        [(0.5, 2), (1.5, 1)]
+    """
+
+    def __init__(
+        self, iterable: Iterable[Any] = (), width: float = None, origin: float = 0
+    ):
+        if width is not None and width <= 0:
+            raise ValueError("bin width must be positive")
+        self.width = width
+        self.origin = origin
+        self.counts = Counter()
+        self._cumulative = None
+        self.update(iterable)
+
+    def __repr__(self):
+        binning = f", width={self.width}, origin={self.origin}" if self.width else ""
+        return (
+            f"{type(self).__name__}({len(self.counts)} values, n={len(self)}{binning})"
+        )
+
+    def __len__(self) -> int:
+        return self.counts.total()
+
+    def __getitem__(self, value: Any) -> int:
+        return self.counts[self.key(value)]
+
+    def key(self, value: Any) -> Any:
+        """
+        The key under which a value is counted: itself, or the index of its bin
+        """
+        return (
+            value
+            if self.width is None
+            else math.floor((value - self.origin) / self.width)
+        )
+
+    def value(self, key: Any) -> Any:
+        """
+        The value a key stands for: itself, or the midpoint of its bin
+        """
+        return key if self.width is None else self.origin + (key + 0.5) * self.width
+
+    def update(self, iterable: Iterable[Any]) -> "FrequencyTable":
+        """
+        Count every element of an iterable
+        Binned arrays are binned and counted by NumPy, when it is available
+        """
+        if self.width is not None and (data := _vector(iterable)) is not None:
+            import numpy
+
+            keys, counts = numpy.unique(
+                numpy.floor((data - self.origin) / self.width), return_counts=True
+            )
+            self.counts.update(dict(zip(map(int, keys.tolist()), counts.tolist())))
         else:
-            return freq(tuple(i for i in element), walks(consumable, len(element)))
-    return sum(1 for i in consumable if i == element)
+            self.counts.update(
+                iterable if self.width is None else map(self.key, iterable)
+            )
+        self._cumulative = None
+        return self
+
+    def merge(self, other: "FrequencyTable") -> "FrequencyTable":
+        """
+        Fold another table into this one, in place
+        """
+        if (self.width, self.origin) != (other.width, other.origin):
+            raise ValueError("cannot merge tables with different binning")
+        self.counts.update(other.counts)
+        self._cumulative = None
+        return self
+
+    def __iadd__(self, other: "FrequencyTable") -> "FrequencyTable":
+        return self.merge(other)
+
+    def __add__(self, other: "FrequencyTable") -> "FrequencyTable":
+        return type(self)(width=self.width, origin=self.origin).merge(self).merge(other)
+
+    def _total(self) -> int:
+        if not (n := len(self)):
+            raise ValueError("the table is empty")
+        return n
+
+    def items(self) -> list:
+        """
+        (value, count) pairs in ascending order of value
+        """
+        return [(self.value(k), c) for k, c in sorted(self.counts.items())]
+
+    def pmf(self, value: Any) -> float:
+        """
+        The fraction of the collection equal to (or binned with) a value
+        """
+        return self[value] / self._total()
+
+    probability = pmf
+
+    def cdf(self, value: Any) -> float:
+        """
+        The fraction of the collection not exceeding a value (or, when binned, lying in its bin or below)
+        """
+        n = self._total()
+        if self._cumulative is None:
+            keys = sorted(self.counts)
+            self._cumulative = keys, list(accumulate(self.counts[k] for k in keys))
+        keys, cumulative = self._cumulative
+        index = bisect_right(keys, self.key(value))
+        return cumulative[index - 1] / n if index else 0.0
+
+    def mode(self) -> Any:
+        """
+        The most common value (the first counted, on a tie)
+        """
+        self._total()
+        return self.value(self.counts.most_common(1)[0][0])
+
+    def expectation(self) -> complex:
+        """
+        The mean value of the collection, weighing each value by its frequency
+        """
+        return sum(self.value(k) * c for k, c in self.counts.items()) / self._total()
 
 
 def expectation(iterable: Iterable[complex]) -> complex:
     """
     Returns the expectation value of a collection
     """
-    consumable = regenerator(iterable)
-    exVal = 0
-    for i in consumable:
-        exVal += i * (freq(i, consumable)) / len(consumable)
-    return exVal
+    return FrequencyTable(iterable).expectation()
+
+
+def _canonical(item: Any) -> bytes:
+    """
+    An encoding of an item which equal items share: 1, 1.0, True, and Fraction(2, 2) all encode alike
+    Supports str, bytes-like objects, numbers, and tuples of these; map anything else to one of them first
+    """
+    if isinstance(item, str):
+        return b"s" + item.encode("utf-8", "surrogatepass")
+    if isinstance(item, (bytes, bytearray, memoryview)):
+        return b"b" + bytes(item)
+    if isinstance(item, tuple):
+        parts = [_canonical(part) for part in item]
+        return b"t" + b"".join(len(part).to_bytes(4, "little") + part for part in parts)
+    if isinstance(item, Number):
+        if item.imag:
+            return b"c" + _canonical((item.real, item.imag))
+        item = item.real
+        if isinstance(item, Integral):
+            numerator, denominator = int(item), 1
+        else:
+            try:
+                numerator, denominator = item.as_integer_ratio()
+            except (OverflowError, ValueError):
+                return b"f" + repr(float(item)).encode()
+        if denominator == 1:
+            return b"i" + numerator.to_bytes(
+                numerator.bit_length() // 8 + 1, "little", signed=True
+            )
+        return b"q" + _canonical((numerator, denominator))
+    raise TypeError(
+        f"cannot hash an item of type {type(item).__name__}, map it to a str, bytes, or number first"
+    )
+
+
+def _hashes(item: Any) -> tuple:
+    """
+    Two independent 64-bit hashes of an item, from the blake2b digest of its canonical encoding, which unlike hash() agree across processes
+    """
+    return _TWO_WORDS.unpack(blake2b(_canonical(item), digest_size=16).digest())
+
+
+_TWO_WORDS = struct.Struct("<QQ")
+_KEY_HEAD = struct.Struct("<cI")
+
+
+def _pack_key(item: Any) -> bytes:
+    """
+    A reversible encoding of a hashable item, unlike _canonical it keeps the item's type: a tag, the payload's length, and the payload
+    """
+    if isinstance(item, bool):
+        tag, payload = b"?", bytes([item])
+    elif isinstance(item, Integral):
+        item = int(item)
+        tag, payload = b"i", item.to_bytes(
+            item.bit_length() // 8 + 1, "little", signed=True
+        )
+    elif isinstance(item, float):
+        tag, payload = b"f", struct.pack("<d", item)
+    elif isinstance(item, Fraction):
+        tag, payload = b"q", _pack_key(item.numerator) + _pack_key(item.denominator)
+    elif isinstance(item, Decimal):
+        tag, payload = b"d", str(item).encode()
+    elif isinstance(item, complex):
+        tag, payload = b"c", struct.pack("<dd", item.real, item.imag)
+    elif isinstance(item, Real):
+        tag, payload = b"f", struct.pack("<d", float(item))
+    elif isinstance(item, str):
+        tag, payload = b"s", item.encode("utf-8", "surrogatepass")
+    elif isinstance(item, bytes):
+        tag, payload = b"b", bytes(item)
+    elif isinstance(item, tuple):
+        tag, payload = b"t", b"".join(map(_pack_key, item))
+    else:
+        raise TypeError(f"cannot serialize an item of type {type(item).__name__}")
+    return _KEY_HEAD.pack(tag, len(payload)) + payload
+
+
+def _unpack_key(data: bytes, offset: int = 0) -> tuple:
+    """
+    Decode an item packed by _pack_key at the given offset, returning it and the offset just past it
+    """
+    tag, size = _KEY_HEAD.unpack_from(data, offset)
+    start = offset + _KEY_HEAD.size
+    end = start + size
+    payload = bytes(data[start:end])
+    if tag == b"?":
+        return payload != b"\0", end
+    if tag == b"i":
+        return int.from_bytes(payload, "little", signed=True), end
+    if tag == b"f":
+        return struct.unpack("<d", payload)[0], end
+    if tag == b"q":
+        numerator, middle = _unpack_key(data, start)
+        return Fraction(numerator, _unpack_key(data, middle)[0]), end
+    if tag == b"d":
+        return Decimal(payload.decode()), end
+    if tag == b"c":
+        return complex(*struct.unpack("<dd", payload)), end
+    if tag == b"s":
+        return payload.decode("utf-8", "surrogatepass"), end
+    if tag == b"b":
+        return payload, end
+    if tag == b"t":
+        parts = []
+        while start < end:
+            part, start = _unpack_key(data, start)
+            parts.append(part)
+        return tuple(parts), end
+    raise ValueError(f"unknown key tag {tag!r}")
+
+
+class CountMin:
+    """
+    A Count-Min sketch: approximate frequencies of the items of a stream in fixed memory
+    Estimates never fall short, and exceed the truth by more than eps times the stream's length with probability at most delta
+    Items are str, bytes, numbers, or tuples of these, and equal items are counted together
+    :conservative:
+        only raise the counters an update must raise, which tightens estimates
+    :k:
+        how many of the most frequent items to keep track of, see heavy_hitters
+    eg
+        >>> sketch = CountMin(eps=0.001, delta=0.01, k=2)
+        >>> sketch.update("abracadabra")
+        >>> sketch["a"], sketch.heavy_hitters()
+        (5, [('a', 5), ('b', 2)])
+    """
+
+    header = struct.Struct("<8sIIIQ?")
+    magic = b"sl4ngcm1"
+
+    def __init__(
+        self,
+        width: int = 2048,
+        depth: int = 5,
+        eps: float = None,
+        delta: float = None,
+        conservative: bool = True,
+        k: int = 0,
+    ):
+        self.width = ceil(math.e / eps) if eps else width
+        self.depth = ceil(log(1 / delta)) if delta else depth
+        self.conservative = conservative
+        self.k = k
+        self.total = 0
+        self.table = array("Q", bytes(8 * self.width * self.depth))
+        self.top = {}
+        self._floor = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(width={self.width}, depth={self.depth}, total={self.total})"
+
+    def _cells(self, item: Any) -> list:
+        h1, h2 = _hashes(item)
+        width = self.width
+        return [row * width + (h1 + row * h2) % width for row in range(self.depth)]
+
+    def add(self, item: Any, count: int = 1) -> int:
+        """
+        Count an item, returning its new estimated frequency
+        """
+        table, cells = self.table, self._cells(item)
+        self.total += count
+        if self.conservative:
+            estimate = min(table[cell] for cell in cells) + count
+            for cell in cells:
+                if table[cell] < estimate:
+                    table[cell] = estimate
+        else:
+            for cell in cells:
+                table[cell] += count
+            estimate = min(table[cell] for cell in cells)
+        if self.k:
+            self._track(item, estimate)
+        return estimate
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Count every item of an iterable
+        """
+        add = self.add
+        for item in iterable:
+            add(item)
+
+    def _track(self, item: Any, estimate: int) -> None:
+        top = self.top
+        if item in top or len(top) < self.k:
+            top[item] = estimate
+        elif estimate > self._floor:
+            weakest = min(top, key=top.get)
+            if estimate > top[weakest]:
+                del top[weakest]
+                top[item] = estimate
+            self._floor = min(top.values())
+
+    def estimate(self, item: Any) -> int:
+        """
+        The estimated number of occurrences of an item
+        """
+        table = self.table
+        return min(table[cell] for cell in self._cells(item))
+
+    __getitem__ = estimate
+
+    def probability(self, item: Any) -> float:
+        """
+        The estimated fraction of the stream taken up by an item
+        """
+        return self.estimate(item) / self.total if self.total else 0.0
+
+    def heavy_hitters(self) -> list:
+        """
+        The k most frequent items seen, as (item, estimate) pairs in descending order of frequency
+        """
+        return sorted(self.top.items(), key=lambda pair: -pair[1])
+
+    def merge(self, other: "CountMin") -> "CountMin":
+        """
+        Fold in a sketch of the same dimensions, in place
+        The merged counters are the sums of the two, so estimates remain upper bounds
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("cannot merge sketches of different dimensions")
+        self.table = array("Q", map(sum, zip(self.table, other.table)))
+        self.total += other.total
+        if self.k:
+            candidates = {**self.top, **other.top}
+            self.top, self._floor = {}, 0
+            for item in candidates:
+                self._track(item, self.estimate(item))
+        return self
+
+    def __iadd__(self, other: "CountMin") -> "CountMin":
+        return self.merge(other)
+
+    def __add__(self, other: "CountMin") -> "CountMin":
+        return (
+            type(self)(self.width, self.depth, conservative=self.conservative, k=self.k)
+            .merge(self)
+            .merge(other)
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch, including its heavy hitters
+        """
+        head = self.header.pack(
+            self.magic, self.width, self.depth, self.k, self.total, self.conservative
+        )
+        table = self.table
+        if sys.byteorder != "little":
+            table = array("Q", table)
+            table.byteswap()
+        top = [
+            struct.pack("<Q", estimate) + _pack_key(item)
+            for item, estimate in self.top.items()
+        ]
+        return head + table.tobytes() + b"".join(top)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CountMin":
+        """
+        Rebuild a sketch from the output of to_bytes
+        """
+        magic, width, depth, k, total, conservative = cls.header.unpack_from(data)
+        if magic != cls.magic:
+            raise ValueError("not a serialized CountMin sketch")
+        sketch = cls(width, depth, conservative=conservative, k=k)
+        sketch.total = total
+        offset = cls.header.size + 8 * width * depth
+        sketch.table = array("Q", data[cls.header.size : offset])
+        if sys.byteorder != "little":
+            sketch.table.byteswap()
+        while offset < len(data):
+            (estimate,) = struct.unpack_from("<Q", data, offset)
+            item, offset = _unpack_key(data, offset + 8)
+            sketch.top[item] = estimate
+        sketch._floor = min(sketch.top.values(), default=0)
+        return sketch
+
+
+class HyperLogLog:
+    """
+    A HyperLogLog sketch: the approximate number of distinct items in a stream, in 2**p bytes
+    The relative error is about 1.04 / sqrt(2**p), under 1% at the default precision
+    Items are str, bytes, numbers, or tuples of these, and equal items are counted once
+    eg
+        >>> sketch = HyperLogLog()
+        >>> sketch.update(range(100000))
+        >>> len(sketch)  # doctest: +SKIP
+        100428
+    """
+
+    header = struct.Struct("<8sB")
+    magic = b"sl4nghl1"
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("precision must lie between 4 and 18")
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(p={self.p}, cardinality~{len(self)})"
+
+    def add(self, item: Any) -> None:
+        """
+        Count an item
+        """
+        h = _hashes(item)[0]
+        rest = 64 - self.p
+        index, bits = h >> rest, h & ((1 << rest) - 1)
+        rank = rest - bits.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, iterable: Iterable[Any]) -> None:
+        """
+        Count every item of an iterable
+        """
+        add = self.add
+        for item in iterable:
+            add(item)
+
+    def cardinality(self) -> float:
+        """
+        The estimated number of distinct items counted
+        """
+        m = len(self.registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        harmonic = fsum(
+            self.registers.count(rank) * 2.0**-rank for rank in range(66 - self.p)
+        )
+        estimate = alpha * m * m / harmonic
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            return m * log(m / zeros)
+        return estimate
+
+    def __len__(self) -> int:
+        return round(self.cardinality())
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """
+        Fold in a sketch of the same precision, in place, to count the union of their streams
+        """
+        if self.p != other.p:
+            raise ValueError("cannot merge sketches of different precisions")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def __iadd__(self, other: "HyperLogLog") -> "HyperLogLog":
+        return self.merge(other)
+
+    def __add__(self, other: "HyperLogLog") -> "HyperLogLog":
+        return type(self)(self.p).merge(self).merge(other)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the sketch
+        """
+        return self.header.pack(self.magic, self.p) + self.registers
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        """
+        Rebuild a sketch from the output of to_bytes
+        """
+        magic, p = cls.header.unpack_from(data)
+        if magic != cls.magic or len(data) != cls.header.size + (1 << p):
+            raise ValueError("not a serialized HyperLogLog sketch")
+        sketch = cls(p)
+        sketch.registers[:] = data[cls.header.size :]
+        return sketch
+
+
+_BACKENDS = ("auto", "numpy", "python")
+_default_backend = os.environ.get("SL4NG_BACKEND", "auto").lower()
+if _default_backend not in _BACKENDS:
+    warnings.warn(
+        f'SL4NG_BACKEND must be one of {_BACKENDS}, not {_default_backend!r}, falling back to "auto"'
+    )
+    _default_backend = "auto"
+_backend = ContextVar("sl4ng_backend", default=_default_backend)
+
+
+@contextmanager
+def backend(name: str) -> Generator:
+    """
+    Force the numerical backend of the summary statistics within a with-block
+    "auto" (the default, or whatever SL4NG_BACKEND names) vectorizes ndarrays, array.arrays, and memoryviews when NumPy is installed
+    "numpy" vectorizes any input, "python" none
+    The choice is held in a context variable, so it is local to the current thread (or asyncio task), and is handed on to the module's process pools
+    eg
+        >>> with backend("python"):
+        ...     mean(array("d", [1, 2, 3]))
+        2.0
+    """
+    if name not in _BACKENDS:
+        raise ValueError(f"backend must be one of {_BACKENDS}, not {name!r}")
+    token = _backend.set(name)
+    try:
+        yield name
+    finally:
+        _backend.reset(token)
+
+
+_shared = {}
+
+
+def _initialize_worker(name: str, shared: dict) -> None:
+    _backend.set(name)
+    _shared.update(shared)
+
+
+def _pool(processes: int, **shared: Any) -> ProcessPoolExecutor:
+    """
+    A process pool whose workers use the caller's backend, and hold the given keyword arguments in _shared, sent once per worker rather than once per task
+    """
+    return ProcessPoolExecutor(
+        processes, initializer=_initialize_worker, initargs=(_backend.get(), shared)
+    )
+
+
+def _vector(iterable: Iterable[complex]) -> Any:
+    """
+    The flat float64 (or complex128) NumPy array a computation should be handed to, or None to stay in pure Python
+    """
+    if _backend.get() == "python":
+        return None
+    try:
+        import numpy
+    except ImportError:
+        if _backend.get() == "numpy":
+            raise
+        return None
+    if isinstance(iterable, (numpy.ndarray, array, memoryview)):
+        data = numpy.asarray(iterable)
+    elif _backend.get() == "numpy":
+        data = numpy.asarray(list(iterable))
+    else:
+        return None
+    if data.dtype.kind not in "biufc":
+        if _backend.get() == "numpy":
+            raise TypeError(f"the NumPy backend cannot summarize {data.dtype} data")
+        return None
+    return data.astype(
+        numpy.complex128 if data.dtype.kind == "c" else numpy.float64, copy=False
+    ).ravel()
+
+
+def _vector_var(data: Any, ddof: int) -> complex:
+    """
+    The variance of an array, E(x - mean)**2 rather than NumPy's E|x - mean|**2 for complex data, to agree with the pure Python path
+    """
+    if data.dtype.kind != "c":
+        return data.var(ddof=ddof).item()
+    deviations = data - data.mean()
+    return ((deviations * deviations).sum() / (data.size - ddof)).item()
+
+
+def _enough(count: int, n: int) -> None:
+    if count < n:
+        raise ValueError(f"at least {n} sample{'s' * (n > 1)} needed, got {count}")
+
+
+class Moments:
+    """
+    A single-pass accumulator of the count, mean, and second to fourth central moments of a stream of numbers
+    Samples are pushed with Welford's update, and accumulators built over separate chunks, threads, or processes
+    combine exactly with Chan et al.'s pairwise formulas, so the result does not depend on how the data was split
+    eg
+        >>> m = Moments(range(10))
+        >>> m.mean, m.popvar
+        (4.5, 8.25)
+        >>> (Moments(range(5)) + Moments(range(5, 10))).popvar
+        8.25
+    """
+
+    def __init__(self, iterable: Iterable[float] = ()):
+        self.n = 0
+        self._mean = self.m2 = self.m3 = self.m4 = 0
+        self.push_many(iterable)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n={self.n}, mean={self._mean!r}, m2={self.m2!r})"
+
+    def __len__(self) -> int:
+        return self.n
+
+    def push(self, value: float) -> "Moments":
+        """
+        Add one sample
+        """
+        n1 = self.n
+        self.n = n = n1 + 1
+        delta = value - self._mean
+        dn = delta / n
+        dn2 = dn * dn
+        term = delta * dn * n1
+        self._mean += dn
+        self.m4 += (
+            term * dn2 * (n * n - 3 * n + 3) + 6 * dn2 * self.m2 - 4 * dn * self.m3
+        )
+        self.m3 += term * dn * (n - 2) - 3 * dn * self.m2
+        self.m2 += term
+        return self
+
+    def push_many(self, iterable: Iterable[float]) -> "Moments":
+        """
+        Add every sample from an iterable
+        Arrays are reduced with vectorized float64 sums, when NumPy is available, and merged in as a single chunk
+        """
+        if (data := _vector(iterable)) is not None:
+            if data.size:
+                chunk = type(self)()
+                chunk.n = int(data.size)
+                chunk._mean = data.mean().item()
+                deviations = data - chunk._mean
+                squares = deviations * deviations
+                chunk.m2 = squares.sum().item()
+                chunk.m3 = (squares * deviations).sum().item()
+                chunk.m4 = (squares * squares).sum().item()
+                self.merge(chunk)
+            return self
+        push = self.push
+        for value in iterable:
+            push(value)
+        return self
+
+    def merge(self, other: "Moments") -> "Moments":
+        """
+        Fold another accumulator into this one, in place
+        """
+        na, nb = self.n, other.n
+        if not nb:
+            return self
+        if not na:
+            self.n, self._mean = other.n, other._mean
+            self.m2, self.m3, self.m4 = other.m2, other.m3, other.m4
+            return self
+        n = na + nb
+        delta = other._mean - self._mean
+        d2 = delta * delta
+        m2 = self.m2 + other.m2 + d2 * na * nb / n
+        m3 = (
+            self.m3
+            + other.m3
+            + d2 * delta * na * nb * (na - nb) / n**2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / n
+        )
+        m4 = (
+            self.m4
+            + other.m4
+            + d2 * d2 * na * nb * (na * na - na * nb + nb * nb) / n**3
+            + 6 * d2 * (na * na * other.m2 + nb * nb * self.m2) / n**2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / n
+        )
+        self.n, self._mean = n, self._mean + delta * nb / n
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        return self
+
+    def __iadd__(self, other: "Moments") -> "Moments":
+        return self.merge(other)
+
+    def __add__(self, other: "Moments") -> "Moments":
+        return type(self)().merge(self).merge(other)
+
+    def _need(self, n: int) -> None:
+        _enough(self.n, n)
+
+    def _need_spread(self) -> None:
+        self._need(1)
+        if not self.m2:
+            raise ValueError("the shape of data without any spread is undefined")
+
+    @property
+    def mean(self) -> float:
+        self._need(1)
+        return self._mean
+
+    @property
+    def popvar(self) -> float:
+        self._need(1)
+        return self.m2 / self.n
+
+    @property
+    def samvar(self) -> float:
+        self._need(2)
+        return self.m2 / (self.n - 1)
+
+    @property
+    def popdev(self) -> float:
+        return _root(self.popvar)
+
+    @property
+    def samdev(self) -> float:
+        return _root(self.samvar)
+
+    @property
+    def skewness(self) -> float:
+        """
+        Population skewness, m3 / m2**1.5
+        """
+        self._need_spread()
+        return self.n ** (1 / 2) * self.m3 / self.m2 ** (3 / 2)
+
+    @property
+    def kurtosis(self) -> float:
+        """
+        Population excess kurtosis, m4 / m2**2 - 3
+        """
+        self._need_spread()
+        return self.n * self.m4 / (self.m2 * self.m2) - 3
+
+
+def _root(value: complex) -> complex:
+    return value.sqrt() if isinstance(value, Decimal) else value ** (1 / 2)
+
+
+def _divide(total: complex, n: int) -> complex:
+    try:
+        return total / n
+    except OverflowError:
+        return Fraction(total, n)
+
+
+def _second_moments(iterable: Iterable[complex]) -> tuple:
+    """
+    The count, mean, and sum of squared deviations of a collection
+    Floats and complex numbers stream through Moments; other numbers (ints, Fractions, Decimals) are summed exactly, in two passes, keeping their type
+    """
+    items = list(iterable)
+    if any(isinstance(i, (float, complex)) for i in items):
+        moments = Moments(items)
+        return moments.n, moments._mean, moments.m2
+    if not items:
+        return 0, 0, 0
+    average = _divide(sum(items), len(items))
+    return len(items), average, sum((i - average) ** 2 for i in items)
 
 
 def mean(iterable: Iterable[complex]) -> complex:
     """
     Returns the mean value of a collection
     """
-    consumable = regenerator(iterable)
-    meanVal = sum(consumable)
-    meanVal /= len(consumable)
-    return meanVal
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        return data.mean().item()
+    n, average, _ = _second_moments(iterable)
+    _enough(n, 1)
+    return average
+
+
+_pivots = (
+    random.Random()
+)  # a generator of its own, so that selection leaves the global one's state alone
+
+
+def _select(items: list, k: int) -> tuple:
+    """
+    Introselect: the k-th and (k+1)-th smallest elements of a list (the latter is None if k is the last index)
+    Partitions around a median-of-three pivot in expected O(n), falling back to sorting small or stubbornly unbalanced inputs
+    """
+    depth = 2 * len(items).bit_length()
+    bound = None  # the least element, set aside so far, above those still in play
+    while True:
+        if len(items) <= 32 or not depth:
+            items = sorted(items)
+            return items[k], items[k + 1] if k + 1 < len(items) else bound
+        depth -= 1
+        pivot = sorted(_pivots.sample(items, 3))[1]
+        lows = [x for x in items if x < pivot]
+        if k < len(lows):
+            items, bound = lows, pivot
+            continue
+        highs = [x for x in items if x > pivot]
+        equals = len(items) - len(lows) - len(highs)
+        k -= len(lows)
+        if k + 1 < equals:
+            return pivot, pivot
+        if k < equals:
+            return pivot, min(highs) if highs else bound
+        k -= equals
+        items = highs
+
+
+def select(iterable: Iterable[Any], k: int) -> Any:
+    """
+    Returns the k-th smallest element of a collection (counting from 0, negative k counts from the largest) in expected linear time
+    """
+    items = list(iterable)
+    if not -len(items) <= k < len(items):
+        raise IndexError(f"cannot select element {k} from {len(items)} elements")
+    return _select(items, k % len(items))[0]
+
+
+def quantile(iterable: Iterable[Real], q: float) -> float:
+    """
+    Returns the q-th quantile of a collection, interpolating linearly between the order statistics on either side of (n - 1) * q
+    Found by selection rather than sorting
+    """
+    if not 0 <= q <= 1:
+        raise ValueError("q must lie in [0, 1]")
+    items = list(iterable)
+    if not items:
+        raise ValueError("quantile of empty data")
+    position = (len(items) - 1) * q
+    k = int(position)
+    low, high = _select(items, k)
+    return low if high is None or position == k else low + (high - low) * (position - k)
 
 
 def median(iterable: Iterable[complex]) -> complex:
     """
     Returns the median value of a collection
-    Will avoid consuming a generator/map/filter
     """
-    # consumable = regurge(iterable)
-    consumable = regenerator(sorted(iterable))
-    if len(consumable) % 2:
-        index = round((len(consumable) - 1) / 2)
-        middle = consumable[index]
-    else:
-        index = round((len(consumable)) / 2) - 1
-        middle = sum(consumable[index : index + 2]) / 2
-    return middle
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        import numpy
+
+        return numpy.median(data).item()
+    items = list(iterable)
+    if not items:
+        raise ValueError("median of empty data")
+    low, high = _select(items, (len(items) - 1) // 2)
+    return low if len(items) % 2 else (low + high) / 2
+
+
+class KLL:
+    """
+    A mergeable KLL sketch of a numeric stream, answering approximate rank and quantile queries in fixed memory
+    Samples enter a stack of compactors; a full compactor sorts itself and promotes every other element, at random, to the level above, where each element weighs twice as much
+    Capacities shrink geometrically with depth, so at most about 3k elements are retained however long the stream
+    :k:
+        accuracy parameter, the worst rank error over the percentiles is typically 2 / k to 3.5 / k of the stream's length
+    :eps:
+        alternatively, the largest rank error to tolerate, which sets k to 4 / eps
+        this held with room to spare on shuffled streams of up to 10**6 samples, but, like the sketch, is a probabilistic bound
+    :seed:
+        seed the coin flips, for reproducible sketches
+    eg
+        >>> sketch = KLL(eps=0.01, seed=0).push_many(range(10**5))
+        >>> sketch.quantile(0.5)
+        50110
+    """
+
+    def __init__(self, k: int = 200, eps: float = None, seed: int = None):
+        self.k = max(ceil(4 / eps), 8) if eps else k
+        self.n = 0
+        self.compactors = [[]]
+        self.random = random.Random(seed)
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(k={self.k}, n={self.n}, retained={self.retained})"
+        )
+
+    @property
+    def retained(self) -> int:
+        return sum(map(len, self.compactors))
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return max(ceil(self.k * (2 / 3) ** depth), 2)
+
+    def _compress(self) -> None:
+        while True:
+            for level, compactor in enumerate(self.compactors):
+                if len(compactor) >= self._capacity(level):
+                    break
+            else:
+                return
+            if level + 1 == len(self.compactors):
+                self.compactors.append([])
+            compactor.sort()
+            kept = [compactor.pop()] if len(compactor) % 2 else []
+            self.compactors[level + 1] += compactor[self.random.getrandbits(1) :: 2]
+            compactor[:] = kept
+
+    def push(self, value: Real) -> "KLL":
+        """
+        Add one sample
+        """
+        self.n += 1
+        self.compactors[0].append(value)
+        if len(self.compactors[0]) >= self._capacity(0):
+            self._compress()
+        return self
+
+    def push_many(self, iterable: Iterable[Real]) -> "KLL":
+        """
+        Add every sample from an iterable
+        """
+        iterator = iter(iterable)
+        while chunk := list(
+            islice(iterator, self._capacity(0) - len(self.compactors[0]))
+        ):
+            self.n += len(chunk)
+            self.compactors[0] += chunk
+            self._compress()
+        return self
+
+    def merge(self, other: "KLL") -> "KLL":
+        """
+        Fold another sketch into this one, in place
+        """
+        while len(self.compactors) < len(other.compactors):
+            self.compactors.append([])
+        for mine, theirs in zip(self.compactors, other.compactors):
+            mine += theirs
+        self.n += other.n
+        self._compress()
+        return self
+
+    def __iadd__(self, other: "KLL") -> "KLL":
+        return self.merge(other)
+
+    def __add__(self, other: "KLL") -> "KLL":
+        return (
+            type(self)(self.k, seed=self.random.getrandbits(32))
+            .merge(self)
+            .merge(other)
+        )
+
+    def _weighted(self) -> list:
+        return sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+
+    def rank(self, value: Real) -> float:
+        """
+        Estimate the fraction of samples not exceeding value
+        """
+        if not self.n:
+            raise ValueError("the sketch is empty")
+        below = sum(w for v, w in self._weighted() if v <= value)
+        return below / sum(w for _, w in self._weighted())
+
+    def quantiles(self, *qs: float) -> list:
+        """
+        Estimate several quantiles with a single sort of the retained samples
+        """
+        if not self.n:
+            raise ValueError("the sketch is empty")
+        weighted = self._weighted()
+        total = sum(w for _, w in weighted)
+        results = []
+        for q in qs:
+            target, cumulative = q * total, 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    break
+            results.append(value)
+        return results
+
+    def quantile(self, q: float) -> Real:
+        """
+        Estimate the q-th quantile of the stream
+        """
+        return self.quantiles(q)[0]
 
 
 def midpoint(iterable: Iterable[complex]) -> complex:
     """
     Returns the midpoint of a collection
-    Will avoid consuming a generator/map/filter
     """
-    consumable = regenerator(iterable)
-    return sum(max(consumable), min(consumable)) / 2
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        return ((data.max() + data.min()) / 2).item()
+    items = list(iterable)
+    _enough(len(items), 1)
+    return (max(items) + min(items)) / 2
 
 
 def central_deviation(iterable: Iterable[complex]) -> complex:
@@ -151,20 +1349,35 @@ def central_deviation(iterable: Iterable[complex]) -> complex:
 def geomean(iterable: Iterable[complex]) -> complex:
     """
     Returns the geometric mean of a collection
+    Positive numbers are averaged as logarithms, so long collections neither overflow nor underflow
     """
-    consumable = regenerator(iterable)
-    geoMean = (sigma(iterable)) ** (1 / len(iterable))
-    return geoMean
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        if data.dtype.kind == "f" and (data > 0).all():
+            import numpy
+
+            return numpy.exp(numpy.log(data).mean()).item()
+        iterable = data.tolist()
+    items = list(iterable)
+    _enough(len(items), 1)
+    if 0 in items:
+        return 0.0
+    if all(isinstance(i, Real) and i > 0 for i in items):
+        return math.exp(fsum(map(log, items)) / len(items))
+    return reduce(mul, items) ** (1 / len(items))
 
 
 def harmean(iterable: Iterable[complex]) -> complex:
     """
     Returns the harmonic mean of a collection
     """
-    consumable = regenerator(iterable)
-    assert 0 not in [
-        i for i in consumable
-    ], "Input contains a zero, try a different one."
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        assert not (data == 0).any(), "Input contains a zero, try a different one."
+        return (data.size / (1 / data).sum()).item()
+    consumable = list(iterable)
+    _enough(len(consumable), 1)
+    assert 0 not in consumable, "Input contains a zero, try a different one."
     reciprocals = [1 / i for i in consumable]
     return len(consumable) / sigma(reciprocals)
 
@@ -173,44 +1386,962 @@ def popdev(iterable: Iterable[complex]) -> complex:
     """
     Returns the population standard deviation of a collection
     """
-    consumable = regenerator(iterable)
-    avg = mean(consumable)
-    v1 = [(i - avg) ** 2 for i in consumable]
-    v2 = ((reduce(lambda x, y: x + y, v1)) / len(v1)) ** (1 / 2)
-    return v2
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        return _root(_vector_var(data, 0))
+    n, _, m2 = _second_moments(iterable)
+    _enough(n, 1)
+    return _root(_divide(m2, n))
 
 
 def samdev(iterable: Iterable[complex]) -> complex:
     """
     Returns the sample standard deviation of a collection
     """
-    consumable = regenerator(iterable)
-    avg = mean(consumable)
-    v1 = [(i - avg) ** 2 for i in consumable]
-    v2 = ((sigma(v1)) / (len(v1) - 1)) ** (1 / 2)
-    return v2
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 2)
+        return _root(_vector_var(data, 1))
+    n, _, m2 = _second_moments(iterable)
+    _enough(n, 2)
+    return _root(_divide(m2, n - 1))
 
 
 def popvar(iterable: Iterable[complex]) -> complex:
     """
     Returns the population variance for a collection
     """
-    consumable = regenerator(iterable)
-    avg = mean(consumable)
-    deviations = [(i - avg) ** 2 for i in consumable]
-    pv = sum(deviations) / len(deviations)
-    return pv
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 1)
+        return _vector_var(data, 0)
+    n, _, m2 = _second_moments(iterable)
+    _enough(n, 1)
+    return _divide(m2, n)
 
 
 def samvar(iterable: Iterable[complex]) -> complex:
     """
     Returns the sample variance for a collection
     """
-    consumable = regenerator(iterable)
-    avg = mean(consumable)
-    v2 = [(i - v1) ** 2 for i in consumable]
-    v3 = sigma(v2) / len(v2)
-    return v3
+    if (data := _vector(iterable)) is not None:
+        _enough(data.size, 2)
+        return _vector_var(data, 1)
+    n, _, m2 = _second_moments(iterable)
+    _enough(n, 2)
+    return _divide(m2, n - 1)
+
+
+class Comoments:
+    """
+    A single-pass accumulator of the means, sums of squared deviations, and co-moment of a stream of (x, y) pairs
+    The bivariate analogue of Moments: pushes follow Welford, merges follow Chan et al., and it answers covariance, correlation, and least-squares line queries
+    eg
+        >>> c = Comoments([1, 2, 3, 4], [2, 4, 5, 8])
+        >>> c.slope, c.intercept
+        (1.9, 0.0)
+        >>> (Comoments([1, 2], [2, 4]) + Comoments([3, 4], [5, 8])).correlation
+        0.9811557810392123
+    """
+
+    def __init__(self, xs: Iterable[float] = (), ys: Iterable[float] = ()):
+        self.n = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2x = self.m2y = self.cxy = 0.0
+        self.push_many(xs, ys)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n={self.n}, mean_x={self.mean_x}, mean_y={self.mean_y}, cxy={self.cxy})"
+
+    def __len__(self) -> int:
+        return self.n
+
+    def push(self, x: float, y: float) -> "Comoments":
+        """
+        Add one pair
+        """
+        self.n = n = self.n + 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / n
+        self.mean_y += dy / n
+        self.m2x += dx * (x - self.mean_x)
+        self.m2y += dy * (y - self.mean_y)
+        self.cxy += dx * (y - self.mean_y)
+        return self
+
+    def push_many(self, xs: Iterable[float], ys: Iterable[float]) -> "Comoments":
+        """
+        Add every pair from two equally long iterables
+        Arrays are reduced with vectorized float64 sums, when NumPy is available, and merged in as a single chunk
+        """
+        if (x := _vector(xs)) is not None and (y := _vector(ys)) is not None:
+            if x.size != y.size:
+                raise ValueError(f"got {x.size} xs but {y.size} ys")
+            if x.size:
+                chunk = type(self)()
+                chunk.n = int(x.size)
+                chunk.mean_x, chunk.mean_y = x.mean().item(), y.mean().item()
+                x, y = x - chunk.mean_x, y - chunk.mean_y
+                chunk.m2x, chunk.m2y, chunk.cxy = (
+                    (x @ x).item(),
+                    (y @ y).item(),
+                    (x @ y).item(),
+                )
+                self.merge(chunk)
+            return self
+        push = self.push
+        try:
+            for x, y in zip(xs, ys, strict=True):
+                push(x, y)
+        except ValueError:
+            raise ValueError("xs and ys differ in length") from None
+        return self
+
+    def merge(self, other: "Comoments") -> "Comoments":
+        """
+        Fold another accumulator into this one, in place
+        """
+        na, nb = self.n, other.n
+        if not nb:
+            return self
+        n = na + nb
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = na * nb / n
+        self.m2x += other.m2x + dx * dx * weight
+        self.m2y += other.m2y + dy * dy * weight
+        self.cxy += other.cxy + dx * dy * weight
+        self.mean_x += dx * nb / n
+        self.mean_y += dy * nb / n
+        self.n = n
+        return self
+
+    def __iadd__(self, other: "Comoments") -> "Comoments":
+        return self.merge(other)
+
+    def __add__(self, other: "Comoments") -> "Comoments":
+        return type(self)().merge(self).merge(other)
+
+    @property
+    def popcov(self) -> float:
+        _enough(self.n, 1)
+        return self.cxy / self.n
+
+    @property
+    def samcov(self) -> float:
+        _enough(self.n, 2)
+        return self.cxy / (self.n - 1)
+
+    @property
+    def correlation(self) -> float:
+        """
+        Pearson's correlation coefficient
+        """
+        _enough(self.n, 2)
+        return self.cxy / math.sqrt(self.m2x * self.m2y)
+
+    @property
+    def slope(self) -> float:
+        """
+        Slope of the least-squares line of y on x
+        """
+        _enough(self.n, 2)
+        return self.cxy / self.m2x
+
+    @property
+    def intercept(self) -> float:
+        """
+        Intercept of the least-squares line of y on x
+        """
+        return self.mean_y - self.slope * self.mean_x
+
+
+def covariance(xs: Iterable[float], ys: Iterable[float]) -> float:
+    """
+    Returns the sample covariance of two collections
+    """
+    return Comoments(xs, ys).samcov
+
+
+def correlation(xs: Iterable[float], ys: Iterable[float]) -> float:
+    """
+    Returns Pearson's correlation coefficient of two collections
+    """
+    return Comoments(xs, ys).correlation
+
+
+def regression(xs: Iterable[float], ys: Iterable[float]) -> tuple:
+    """
+    Returns the slope and intercept of the least-squares line through pairs of points
+    """
+    c = Comoments(xs, ys)
+    return c.slope, c.intercept
+
+
+def comoments(rows: Iterable[Iterable[float]], pairs: Iterable[tuple] = None) -> dict:
+    """
+    Accumulate Comoments for many pairs of columns at once, in one pass over a table's rows
+    Returns a dict mapping each (i, j) pair of column indices, by default every pair with i < j, to its Comoments
+    A 2-D NumPy array is reduced with a single product of its centred columns
+    eg
+        >>> comoments([(1, 2, 3), (2, 4, 1), (3, 5, 2)])[0, 1].correlation
+        0.9819805060619656
+    """
+    data = None
+    if _backend.get() != "python":
+        try:
+            import numpy
+
+            if isinstance(rows, numpy.ndarray) or _backend.get() == "numpy":
+                data = numpy.asarray(
+                    rows if isinstance(rows, numpy.ndarray) else list(rows),
+                    numpy.float64,
+                )
+        except ImportError:
+            if _backend.get() == "numpy":
+                raise
+    if data is not None:
+        if data.ndim != 2:
+            raise ValueError("rows must form a 2-D table")
+        width = data.shape[1]
+        pairs = (
+            [(i, j) for i in range(width) for j in range(i + 1, width)]
+            if pairs is None
+            else list(pairs)
+        )
+        means = data.mean(0) if len(data) else numpy.zeros(width)
+        centred = data - means
+        gram = (centred.T @ centred).tolist()
+        means = means.tolist()
+        result = {}
+        for i, j in pairs:
+            c = result[i, j] = Comoments()
+            if len(data):
+                c.n = len(data)
+                c.mean_x, c.mean_y = means[i], means[j]
+                c.m2x, c.m2y, c.cxy = gram[i][i], gram[j][j], gram[i][j]
+        return result
+    rows = iter(rows)
+    first = next(rows, None)
+    if pairs is None:
+        width = len(first) if first is not None else 0
+        pairs = [(i, j) for i in range(width) for j in range(i + 1, width)]
+    result = {pair: Comoments() for pair in pairs}
+    if first is not None:
+        for row in chain((first,), rows):
+            for (i, j), c in result.items():
+                c.push(row[i], row[j])
+    return result
+
+
+class Aggregate:
+    """
+    Mergeable summary of one stream of numbers: its moments, sum, extrema, and, optionally, a KLL sketch of its quantiles
+    """
+
+    __slots__ = "moments", "total", "low", "high", "sketch"
+
+    def __init__(self, sketch: bool = False, k: int = 200):
+        self.moments = Moments()
+        self.total = 0
+        self.low = self.high = None
+        self.sketch = KLL(k) if sketch else None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(n={self.moments.n}, low={self.low}, high={self.high})"
+
+    def push_many(self, values: list) -> "Aggregate":
+        """
+        Add a batch of samples, vectorized for arrays as in the module's other summaries
+        """
+        if (data := _vector(values)) is not None:
+            if data.size:
+                self.moments.push_many(data)
+                self.total += data.sum().item()
+                self._extend(data.min().item(), data.max().item())
+                if self.sketch is not None:
+                    self.sketch.push_many(data.tolist())
+        elif values:
+            self.moments.push_many(values)
+            self.total += sum(values)
+            self._extend(min(values), max(values))
+            if self.sketch is not None:
+                self.sketch.push_many(values)
+        return self
+
+    def _extend(self, low: Real, high: Real) -> None:
+        self.low = low if self.low is None else min(self.low, low)
+        self.high = high if self.high is None else max(self.high, high)
+
+    def merge(self, other: "Aggregate") -> "Aggregate":
+        """
+        Fold another aggregate into this one, in place
+        """
+        if other.moments.n:
+            self.moments.merge(other.moments)
+            self.total += other.total
+            self._extend(other.low, other.high)
+            if self.sketch is not None and other.sketch is not None:
+                self.sketch.merge(other.sketch)
+        return self
+
+    def __iadd__(self, other: "Aggregate") -> "Aggregate":
+        return self.merge(other)
+
+    def statistic(self, name: str) -> Any:
+        """
+        Evaluate a statistic by name:
+            count, sum, min, max, midpoint, any of Moments' properties (mean, popvar, samvar, popdev, samdev, skewness, kurtosis),
+            or, given a sketch, median and quantiles written as "q0.9"
+        """
+        if name == "count":
+            return self.moments.n
+        if name == "sum":
+            return self.total
+        if name in ("min", "max", "midpoint"):
+            _enough(self.moments.n, 1)
+            if name == "midpoint":
+                return (self.low + self.high) / 2
+            return self.low if name == "min" else self.high
+        if name in _MOMENT_STATISTICS:
+            return getattr(self.moments, name)
+        if self.sketch is None:
+            raise ValueError(f"{name!r} needs a quantile sketch")
+        _enough(self.moments.n, 1)
+        return self.sketch.quantile(0.5 if name == "median" else float(name[1:]))
+
+
+_MOMENT_STATISTICS = (
+    "mean",
+    "popvar",
+    "samvar",
+    "popdev",
+    "samdev",
+    "skewness",
+    "kurtosis",
+)
+_AGGREGATE_STATISTICS = ("count", "sum", "min", "max", "midpoint") + _MOMENT_STATISTICS
+
+
+def _quantile_name(name: str) -> bool:
+    if name == "median":
+        return True
+    try:
+        return name[0] == "q" and 0 <= float(name[1:]) <= 1
+    except ValueError:
+        return False
+
+
+class GroupBy:
+    """
+    Aggregate (key, value) records per key in a single pass, keeping one mergeable Aggregate per key rather than a list of its values
+    Medians and quantiles ("median", "q0.99") are estimated with KLL sketches; every other statistic is exact
+    Partial GroupBys built over separate shards, or processes, merge into the GroupBy of the whole
+    eg
+        >>> groups = GroupBy(["count", "mean", "max"])
+        >>> groups.update([("a", 1), ("b", 2), ("a", 3)]).result()
+        {'a': {'count': 2, 'mean': 2.0, 'max': 3}, 'b': {'count': 1, 'mean': 2.0, 'max': 2}}
+    """
+
+    def __init__(self, statistics: Iterable[str] = ("count", "mean"), k: int = 200):
+        self.statistics = tuple(statistics)
+        for name in self.statistics:
+            if name not in _AGGREGATE_STATISTICS and not _quantile_name(name):
+                raise ValueError(f"unknown statistic {name!r}")
+        self.k = k
+        self.sketch = any(map(_quantile_name, self.statistics))
+        self.groups = {}
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}({list(self.statistics)}, {len(self.groups)} groups)"
+        )
+
+    def __len__(self) -> int:
+        return len(self.groups)
+
+    def _group(self, key: Any) -> Aggregate:
+        if (group := self.groups.get(key)) is None:
+            group = self.groups[key] = Aggregate(self.sketch, self.k)
+        return group
+
+    def _update(self, records: Iterable[tuple], chunksize: int) -> None:
+        records = iter(records)
+        while chunk := list(islice(records, chunksize)):
+            batches = {}
+            for key, value in chunk:
+                if (batch := batches.get(key)) is None:
+                    batches[key] = [value]
+                else:
+                    batch.append(value)
+            for key, batch in batches.items():
+                self._group(key).push_many(batch)
+
+    def update(
+        self, records: Iterable[tuple], processes: int = None, chunksize: int = 1 << 16
+    ) -> "GroupBy":
+        """
+        Consume a stream of (key, value) records
+        Records are batched by key, chunksize at a time; given a number of processes, the chunks are aggregated in a process pool and merged as they finish
+        """
+        if not processes:
+            self._update(records, chunksize)
+            return self
+        records = iter(records)
+        with _pool(processes) as pool:
+            pending = set()
+            while chunk := list(islice(records, chunksize)):
+                pending.add(pool.submit(_groupby_chunk, self.statistics, self.k, chunk))
+                if len(pending) >= 2 * processes:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        self.merge(future.result())
+            for future in as_completed(pending):
+                self.merge(future.result())
+        return self
+
+    def merge(self, other: "GroupBy") -> "GroupBy":
+        """
+        Fold another GroupBy, over the same statistics, into this one, in place
+        """
+        if other.sketch != self.sketch:
+            raise ValueError(
+                "cannot merge groupings with and without quantile sketches"
+            )
+        for key, group in other.groups.items():
+            self._group(key).merge(group)
+        return self
+
+    def __iadd__(self, other: "GroupBy") -> "GroupBy":
+        return self.merge(other)
+
+    def __add__(self, other: "GroupBy") -> "GroupBy":
+        return type(self)(self.statistics, self.k).merge(self).merge(other)
+
+    def result(self) -> dict:
+        """
+        The requested statistics of each group, as a dict of dicts
+        """
+        return {
+            key: {name: group.statistic(name) for name in self.statistics}
+            for key, group in self.groups.items()
+        }
+
+
+def _groupby_chunk(statistics: tuple, k: int, records: list) -> GroupBy:
+    grouped = GroupBy(statistics, k)
+    grouped._update(records, len(records))
+    return grouped
+
+
+def groupby(
+    records: Iterable[tuple],
+    statistics: Iterable[str] = ("count", "mean"),
+    processes: int = None,
+    chunksize: int = 1 << 16,
+) -> dict:
+    """
+    Returns the given statistics of the values of each key in a stream of (key, value) records, computed in one pass
+    See GroupBy for the statistics on offer
+    eg
+        >>> groupby([("a", 1), ("b", 2), ("a", 3)], ["mean", "popdev"])
+        {'a': {'mean': 2.0, 'popdev': 1.0}, 'b': {'mean': 2.0, 'popdev': 0.0}}
+    """
+    return GroupBy(statistics).update(records, processes, chunksize).result()
+
+
+def _file_chunks(size: int, chunksize: int, itemsize: int = 1) -> list:
+    """
+    (start, stop) offsets splitting a file into chunks which start on allocation-granularity boundaries, as mmap requires, and on whole items
+    """
+    step = math.lcm(mmap.ALLOCATIONGRANULARITY, itemsize)
+    step *= max(chunksize // step, 1)
+    return [(start, min(start + step, size)) for start in range(0, size, step)]
+
+
+def _summarize_chunk(
+    path: str,
+    start: int,
+    stop: int,
+    typecode: str,
+    column: int,
+    delimiter: bytes,
+    header: bool,
+    width: float,
+    origin: float,
+) -> tuple:
+    """
+    The Aggregate, and the FrequencyTable if given a bin width, of the numbers in one chunk of a file
+    Text chunks own the lines which begin inside them, reading past their end to finish the last one
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        length = (stop if typecode else size) - start
+        with mmap.mmap(
+            file.fileno(), length, offset=start, access=mmap.ACCESS_READ
+        ) as view:
+            if typecode:
+                values = memoryview(view)[
+                    : length - length % array(typecode).itemsize
+                ].cast(typecode)
+            else:
+                begin = 0
+                if start:
+                    file.seek(start - 1)
+                    if file.read(1) != b"\n":
+                        begin = view.find(b"\n") + 1 or length
+                end = view.find(b"\n", stop - start - 1) + 1 or length
+                lines = view[begin:end].split(b"\n") if begin < stop - start else []
+                if header and not start:
+                    lines = lines[1:]
+                values = [
+                    float(field)
+                    for line in lines
+                    if line.strip() and (field := line.split(delimiter)[column].strip())
+                ]
+            aggregate = Aggregate().push_many(values)
+            table = (
+                FrequencyTable(values, width, origin)
+                if width and aggregate.moments.n
+                else None
+            )
+            if isinstance(values, memoryview):
+                values.release()
+    return aggregate, table
+
+
+def summarize_file(
+    path: str,
+    typecode: str = None,
+    column: int | str = 0,
+    delimiter: str = ",",
+    header: bool = False,
+    bins: int = 64,
+    width: float = None,
+    processes: int = None,
+    chunksize: int = 1 << 24,
+) -> dict:
+    """
+    Summarize the numbers in a file too large to load: a raw binary array of the given array typecode, or else a column of a CSV/text file
+    The file is memory-mapped in chunks aligned to mmap.ALLOCATIONGRANULARITY, each chunk is summarized in a process pool, and the per-chunk accumulators are merged
+    Returns the count, mean, variances, deviations, skewness, kurtosis, extrema, a histogram (as a binned FrequencyTable), and the histogram's entropy in bits
+    :column:
+        the index of the column to read, or its name if the file has a header row
+    :bins:
+        the number of histogram bins spanning the data's range, which takes a second pass over the file
+    :width:
+        alternatively, a fixed bin width for a single-pass histogram whose bins start at 0
+    :processes:
+        size of the process pool, 1 summarizes in this process
+    eg
+        >>> summarize_file("latencies.f64", "d")["popdev"]  # doctest: +SKIP
+        12.40335
+    """
+    size = os.path.getsize(path)
+    delimiter = delimiter.encode()
+    if typecode is None and isinstance(column, str):
+        if not header:
+            raise ValueError("columns can only be named in files with a header")
+        with open(path, "rb") as file:
+            column = [name.strip() for name in file.readline().split(delimiter)].index(
+                column.encode()
+            )
+    chunks = _file_chunks(size, chunksize, array(typecode).itemsize if typecode else 1)
+    arguments = (typecode, column, delimiter, header)
+
+    def run(width: float, origin: float) -> list:
+        jobs = [
+            (path, start, stop, *arguments, width, origin) for start, stop in chunks
+        ]
+        if processes == 1:
+            return [_summarize_chunk(*job) for job in jobs]
+        with _pool(processes) as pool:
+            return list(pool.map(_summarize_chunk, *zip(*jobs)))
+
+    results = run(width, 0)
+    aggregate = reduce(Aggregate.merge, (a for a, _ in results), Aggregate())
+    moments = aggregate.moments
+    if not moments.n:
+        raise ValueError(f"no numbers found in {path}")
+    if width:
+        histogram = reduce(
+            FrequencyTable.merge,
+            (t for _, t in results if t),
+            FrequencyTable(width=width),
+        )
+    else:
+        span = (aggregate.high - aggregate.low) / bins or 1
+        histogram = reduce(
+            FrequencyTable.merge,
+            (t for _, t in run(span, aggregate.low) if t),
+            FrequencyTable(width=span, origin=aggregate.low),
+        )
+        if bins in histogram.counts:
+            histogram.counts[bins - 1] += histogram.counts.pop(bins)
+    summary = {
+        "count": moments.n,
+        "sum": aggregate.total,
+        "min": aggregate.low,
+        "max": aggregate.high,
+    }
+    for name in _MOMENT_STATISTICS:
+        try:
+            summary[name] = getattr(moments, name)
+        except ValueError:
+            summary[name] = math.nan
+    summary["histogram"] = histogram
+    summary["entropy"] = _entropy(histogram.counts.values())
+    return summary
+
+
+def _windowed(
+    iterable: Iterable[Any], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Slide a window over a stream, yielding each new value, the values it pushes out of the window, and the window's contents
+    :window:
+        the number of most recent values in the window
+    :span:
+        alternatively, the stream is of (timestamp, value) pairs in time order, and the window holds the values stamped within span of the latest
+    """
+    if (window is None) == (span is None):
+        raise ValueError("give either a window (a count) or a span (a duration)")
+    buffer = deque()
+    if window is not None:
+        if window < 1:
+            raise ValueError("window must be positive")
+        for value in iterable:
+            buffer.append(value)
+            yield value, (buffer.popleft(),) if len(buffer) > window else (), buffer
+    else:
+        if not span > span * 0:
+            raise ValueError("span must be positive")
+        stamps = deque()
+        for stamp, value in iterable:
+            stamps.append(stamp)
+            buffer.append(value)
+            horizon = stamp - span
+            evicted = []
+            while stamps[0] <= horizon:
+                stamps.popleft()
+                evicted.append(buffer.popleft())
+            yield value, evicted, buffer
+
+
+def _rolling_sums(
+    iterable: Iterable[Real], window: int, span: Any, transform: Callable
+) -> Generator:
+    """
+    Yield the sum of the transformed values in a sliding window, and their number
+    The sum is updated as values come and go, and recomputed once every window's worth of steps so rounding errors cannot pile up
+    """
+    total, steps = 0.0, 0
+    for value, evicted, buffer in _windowed(iterable, window, span):
+        steps += 1
+        if steps >= len(buffer):
+            total, steps = fsum(map(transform, buffer)), 0
+        else:
+            total += transform(value) - fsum(map(transform, evicted))
+        yield total, len(buffer)
+
+
+def rolling_mean(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the mean of a sliding window at each step of a stream, in constant time per step
+    Like the other rolling statistics, the window either holds the last window values,
+    or, given a span instead, the stream is of (timestamp, value) pairs and the window holds the values stamped within span of the latest
+    eg
+        >>> [*rolling_mean([1, 2, 3, 4], 2)]
+        [1.0, 1.5, 2.5, 3.5]
+        >>> [*rolling_mean([(0, 1), (1, 2), (5, 3)], span=3)]
+        [1.0, 1.5, 3.0]
+    """
+    for total, n in _rolling_sums(iterable, window, span, float):
+        yield total / n
+
+
+def rolling_geomean(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the geometric mean of a sliding window of positive numbers at each step of a stream, from a running sum of logarithms
+    """
+    for total, n in _rolling_sums(iterable, window, span, log):
+        yield math.exp(total / n)
+
+
+def rolling_harmean(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the harmonic mean of a sliding window of non-zero numbers at each step of a stream, from a running sum of reciprocals
+    """
+    for total, n in _rolling_sums(iterable, window, span, lambda x: 1 / x):
+        yield n / total
+
+
+def rolling_popvar(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the population variance of a sliding window at each step of a stream
+    Welford's update runs forwards for arrivals and backwards for departures, and is refreshed from the window once every window's worth of steps
+    """
+    n, mean, m2, steps = 0, 0.0, 0.0, 0
+    for value, evicted, buffer in _windowed(iterable, window, span):
+        steps += 1
+        if steps >= len(buffer):
+            moments = Moments(buffer)
+            n, mean, m2, steps = moments.n, moments.mean, moments.m2, 0
+        else:
+            n += 1
+            delta = value - mean
+            mean += delta / n
+            m2 += delta * (value - mean)
+            for old in evicted:
+                n -= 1
+                delta = old - mean
+                mean -= delta / n
+                m2 -= delta * (old - mean)
+        yield max(m2, 0.0) / n
+
+
+class _SlidingMedian:
+    """
+    Two heaps holding the lower and upper halves of a multiset, with lazy deletion, for O(log n) insertion, removal, and median
+    """
+
+    def __init__(self):
+        self.low, self.high = [], []  # the lower half is negated to serve as a max-heap
+        self.nlow = self.nhigh = 0
+        self.delayed = Counter()
+
+    def _prune(self, heap: list, sign: int) -> None:
+        while heap and self.delayed[sign * heap[0]]:
+            self.delayed[sign * heap[0]] -= 1
+            heappop(heap)
+
+    def _balance(self) -> None:
+        if self.nlow > self.nhigh + 1:
+            heappush(self.high, -heappop(self.low))
+            self.nlow, self.nhigh = self.nlow - 1, self.nhigh + 1
+            self._prune(self.low, -1)
+        elif self.nlow < self.nhigh:
+            heappush(self.low, -heappop(self.high))
+            self.nlow, self.nhigh = self.nlow + 1, self.nhigh - 1
+            self._prune(self.high, 1)
+
+    def push(self, value: Real) -> None:
+        if not self.low or value <= -self.low[0]:
+            heappush(self.low, -value)
+            self.nlow += 1
+        else:
+            heappush(self.high, value)
+            self.nhigh += 1
+        self._balance()
+
+    def remove(self, value: Real) -> None:
+        self.delayed[value] += 1
+        if value <= -self.low[0]:
+            self.nlow -= 1
+            self._prune(self.low, -1)
+        else:
+            self.nhigh -= 1
+            self._prune(self.high, 1)
+        self._balance()
+
+    def median(self) -> Real:
+        if self.nlow > self.nhigh:
+            return -self.low[0]
+        return (-self.low[0] + self.high[0]) / 2
+
+
+def rolling_median(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the median of a sliding window at each step of a stream, in O(log w) time per step
+    eg
+        >>> [*rolling_median([5, 1, 4, 2, 3], 3)]
+        [5, 3.0, 4, 2, 3]
+    """
+    halves = _SlidingMedian()
+    for value, evicted, buffer in _windowed(iterable, window, span):
+        halves.push(value)
+        for old in evicted:
+            halves.remove(old)
+        yield halves.median()
+
+
+def rolling_band(
+    iterable: Iterable[Real], window: int = None, span: Any = None
+) -> Generator:
+    """
+    Yield the extrema, (min, max), of a sliding window at each step of a stream, in amortized constant time, using monotonic deques
+    eg
+        >>> [*rolling_band([3, 1, 2, 5], 2)]
+        [(3, 3), (1, 3), (1, 2), (2, 5)]
+    """
+    lows, highs = deque(), deque()
+    arrivals = departures = 0
+    for value, evicted, buffer in _windowed(iterable, window, span):
+        while lows and lows[-1][1] > value:
+            lows.pop()
+        while highs and highs[-1][1] < value:
+            highs.pop()
+        lows.append((arrivals, value))
+        highs.append((arrivals, value))
+        arrivals += 1
+        departures += len(evicted)
+        while lows[0][0] < departures:
+            lows.popleft()
+        while highs[0][0] < departures:
+            highs.popleft()
+        yield lows[0][1], highs[0][1]
+
+
+@dataclass(slots=True, frozen=True)
+class Bootstrap:
+    """
+    A statistic's estimate from the full data, its confidence interval, and the replicates the interval was read from
+    """
+
+    estimate: Any
+    low: float
+    high: float
+    replicates: tuple = field(repr=False)
+
+
+def _bootstrap_chunk(
+    statistic: Callable, count: int, seed: int, data: Any = None
+) -> list:
+    """
+    Evaluate a statistic on count resamples of the data (by default, the data shared with this pool worker), drawn with a generator of its own
+    NumPy arrays are resampled by fancy indexing with a block of random indices at a time, anything else by random.choices
+    """
+    data = _shared["data"] if data is None else data
+    if not isinstance(data, (list, tuple)):
+        import numpy
+
+        rng = numpy.random.default_rng(seed)
+        block = max(1, (1 << 22) // len(data))
+        replicates = []
+        for done in range(0, count, block):
+            indices = rng.integers(
+                0, len(data), size=(min(block, count - done), len(data))
+            )
+            replicates += map(statistic, data[indices])
+        return replicates
+    rng = random.Random(seed)
+    return [statistic(sample(data, len(data), rng)) for _ in range(count)]
+
+
+def _jackknife_chunk(
+    statistic: Callable, start: int, stop: int, data: Any = None
+) -> list:
+    data = _shared["data"] if data is None else data
+    if not isinstance(data, (list, tuple)):
+        import numpy
+
+        return [statistic(numpy.delete(data, i, 0)) for i in range(start, stop)]
+    return [statistic(data[:i] + data[i + 1 :]) for i in range(start, stop)]
+
+
+def bootstrap(
+    data: Iterable[Any],
+    statistic: Callable = mean,
+    resamples: int = 2000,
+    confidence: float = 0.95,
+    method: str = "bca",
+    seed: int = None,
+    processes: int = None,
+    chunksize: int = 250,
+) -> Bootstrap:
+    """
+    Estimate a confidence interval for a statistic by resampling the data with replacement
+    Chunks of replicates are evaluated in a process pool, each with an independently seeded generator, so a given seed reproduces the interval
+    NumPy arrays are resampled by vectorized index generation, and the statistic receives each resample as an array
+    :statistic:
+        any function of a collection, picklable (module-level) unless processes=1
+    :method:
+        "percentile", or "bca", the bias-corrected and accelerated interval, which costs one jackknife evaluation per datum, split evenly over the pool
+    :processes:
+        size of the process pool, 1 resamples in this process
+    eg
+        >>> bootstrap(range(100), seed=0)  # doctest: +SKIP
+        Bootstrap(estimate=49.5, low=44.00..., high=55.29...)
+    """
+    if method not in ("percentile", "bca"):
+        raise ValueError(f"unknown method {method!r}")
+    vectorize = False
+    if _backend.get() != "python":
+        try:
+            import numpy
+
+            vectorize = _backend.get() == "numpy" or isinstance(
+                data, (numpy.ndarray, array, memoryview)
+            )
+        except ImportError:
+            if _backend.get() == "numpy":
+                raise
+    if vectorize:
+        data = numpy.asarray(
+            data if isinstance(data, (numpy.ndarray, array, memoryview)) else list(data)
+        )
+    elif not isinstance(data, (list, tuple)):
+        data = list(data)
+    n = len(data)
+    _enough(n, 2)
+    master = random.Random(seed)
+    jobs = [
+        (statistic, min(chunksize, resamples - done), master.getrandbits(64))
+        for done in range(0, resamples, chunksize)
+    ]
+    workers = processes or os.cpu_count() or 1
+    cuts = [n * i // workers for i in range(workers + 1)] if method == "bca" else []
+    if processes == 1:
+        replicates = [r for job in jobs for r in _bootstrap_chunk(*job, data)]
+        jackknife = [
+            j
+            for a, b in zip(cuts, cuts[1:])
+            for j in _jackknife_chunk(statistic, a, b, data)
+        ]
+    else:
+        with _pool(processes, data=data) as pool:
+            replicated = [pool.submit(_bootstrap_chunk, *job) for job in jobs]
+            knifed = [
+                pool.submit(_jackknife_chunk, statistic, a, b)
+                for a, b in zip(cuts, cuts[1:])
+            ]
+            replicates = [r for future in replicated for r in future.result()]
+            jackknife = [j for future in knifed for j in future.result()]
+    estimate = statistic(data)
+    alpha = (1 - confidence) / 2
+    lower, upper = alpha, 1 - alpha
+    if method == "bca":
+        normal = NormalDist()
+        below = (
+            sum(r < estimate for r in replicates)
+            + sum(r == estimate for r in replicates) / 2
+        )
+        bias = normal.inv_cdf(
+            min(
+                max(below / resamples, 1 / (resamples + 1)), resamples / (resamples + 1)
+            )
+        )
+        centre = fsum(jackknife) / n
+        deviations = [centre - j for j in jackknife]
+        spread = fsum(d * d for d in deviations)
+        acceleration = (
+            fsum(d**3 for d in deviations) / (6 * spread**1.5) if spread else 0.0
+        )
+        lower, upper = (
+            normal.cdf(bias + (bias + z) / (1 - acceleration * (bias + z)))
+            for z in (normal.inv_cdf(alpha), normal.inv_cdf(1 - alpha))
+        )
+    low, high = quantile(replicates, lower), quantile(replicates, upper)
+    return Bootstrap(estimate, low, high, tuple(replicates))
 
 
 if __name__ == "__main__":